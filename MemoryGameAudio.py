@@ -0,0 +1,109 @@
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+# Спільний кеш декодованих семплів: шлях до файлу -> pygame.mixer.Sound
+_SAMPLE_CACHE: Dict[str, Any] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+class AudioManager:
+    def __init__(self, sounds: Dict[str, str], channels: Optional[Dict[str, int]] = None,
+                 enabled: bool = True, start: bool = True):
+        """Звукова підсистема, що не блокує запуск гри.
+
+        Імпорт pygame та ініціалізація мікшера виконуються у фоновому потоці;
+        семпли завантажуються у спільний кеш під час простою або при першому
+        відтворенні. Кожен звук має власні канали мікшера, тож швидкі кліки не
+        перебивають один одного. Якщо pygame чи аудіопристрій недоступні, або
+        enabled=False, менеджер мовчки працює як заглушка.
+
+        Args:
+            sounds: Словник назва звуку -> шлях до WAV-файлу
+            channels: Кількість виділених каналів для кожного звуку (за замовчуванням 1)
+            enabled: Чи вмикати звук взагалі (False - заглушка, напр. для тестів без аудіо)
+            start: Чи запускати фонову ініціалізацію одразу (False - пізніше через start())
+        """
+        self.sounds = sounds
+        self.channels_per_sound = channels or {}
+        self._mixer: Any = None  # Модуль pygame.mixer, коли ініціалізовано
+        self._channels: Dict[str, List[Any]] = {}  # Виділені канали для кожного звуку
+        self._next_channel: Dict[str, int] = {}  # Наступний канал у циклі для кожного звуку
+        self.ready = threading.Event()  # Встановлюється, коли ініціалізація завершена (успішно чи ні)
+        self._started = False
+
+        if not enabled:
+            self._started = True
+            self.ready.set()
+        elif start:
+            self.start()
+
+    def start(self) -> None:
+        """Запускає фонову ініціалізацію мікшера (повторні виклики ігноруються)."""
+        if self._started:
+            return
+        self._started = True
+        threading.Thread(target=self._init_backend, name="audio-init", daemon=True).start()
+
+    @property
+    def available(self) -> bool:
+        """Чи працює справжній аудіобекенд (а не заглушка)."""
+        return self._mixer is not None
+
+    def _init_backend(self) -> None:
+        """Фоновий потік: імпорт pygame, запуск мікшера, розподіл каналів, попереднє завантаження."""
+        try:
+            os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # Без банера pygame
+            import pygame
+            pygame.mixer.init()
+            counts = [self.channels_per_sound.get(name, 1) for name in self.sounds]
+            total = sum(counts)
+            pygame.mixer.set_num_channels(max(total, 8))
+            pygame.mixer.set_reserved(total)  # Зарезервовані канали не віддаються іншим звукам
+            first = 0
+            for name, count in zip(self.sounds, counts):
+                self._channels[name] = [pygame.mixer.Channel(i) for i in range(first, first + count)]
+                self._next_channel[name] = 0
+                first += count
+            self._mixer = pygame.mixer
+        except Exception:
+            self._mixer = None  # Немає pygame або аудіопристрою - працюємо без звуку
+        finally:
+            self.ready.set()
+
+        # Попереднє завантаження семплів, поки користувач дивиться на меню
+        if self._mixer is not None:
+            for name in self.sounds:
+                self._load(name)
+
+    def _load(self, name: str) -> Any:
+        """Повертає семпл зі спільного кешу, завантажуючи його за потреби."""
+        path = self.sounds[name]
+        with _CACHE_LOCK:
+            sound = _SAMPLE_CACHE.get(path)
+            if sound is None:
+                try:
+                    sound = self._mixer.Sound(path)
+                except Exception:
+                    return None  # Файл відсутній або пошкоджений - просто без звуку
+                _SAMPLE_CACHE[path] = sound
+            return sound
+
+    def play(self, name: str) -> None:
+        """Відтворює звук, не блокуючи виклик.
+
+        Поки мікшер ініціалізується, або якщо звук недоступний, нічого не робить.
+        Args:
+            name: Назва звуку зі словника sounds
+        """
+        if not self.ready.is_set() or self._mixer is None:
+            return
+        sound = _SAMPLE_CACHE.get(self.sounds[name])
+        if sound is None:
+            sound = self._load(name)
+        if sound is None:
+            return
+        channels = self._channels[name]
+        channel = channels[self._next_channel[name]]
+        self._next_channel[name] = (self._next_channel[name] + 1) % len(channels)
+        channel.play(sound)
@@ -0,0 +1,290 @@
+import argparse
+import contextlib
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import tkinter as tk
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from MemoryGameLogic import MemoryGameLogic
+from MemoryGameGUI import MemoryGameGUI
+
+FRAME_MS = 1000 / 60  # Бюджет одного кадру при 60 Гц
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@contextlib.contextmanager
+def virtual_display() -> Iterator[None]:
+    """Запускає Xvfb на час бенчмарку, якщо DISPLAY не задано і Xvfb встановлено."""
+    if os.environ.get("DISPLAY") or not shutil.which("Xvfb"):
+        yield
+        return
+    display = ":97"
+    server = subprocess.Popen(["Xvfb", display, "-nolisten", "tcp", "-screen", "0", "1024x768x24"],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ["DISPLAY"] = display
+    time.sleep(0.5)  # Даємо серверу піднятися
+    try:
+        yield
+    finally:
+        del os.environ["DISPLAY"]
+        server.terminate()
+        server.wait()
+
+
+def _report(name: str, samples: List[float], budget_ms: Optional[float] = FRAME_MS) -> None:
+    """Друкує середнє, p95 та максимум вибірки в мілісекундах (і порівняння з бюджетом, якщо задано)."""
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    line = (f"{name:>28}: mean={statistics.mean(samples):7.2f} ms  p95={p95:7.2f} ms  "
+            f"max={samples[-1]:7.2f} ms")
+    if budget_ms is not None:
+        line += f"  [{'OK' if p95 < budget_ms else 'SLOW'}, budget={budget_ms:.1f} ms]"
+    print(line)
+
+
+def bench_restart(repeats: int) -> None:
+    """Вимірює затримку перезапуску гри (меню -> нове поле -> перемальовано).
+
+    Порівнює режим пулу віджетів зі старим знищенням і створенням усіх віджетів.
+    Args:
+        repeats: Кількість перезапусків для кожного рівня
+    """
+    levels: Dict[str, tuple] = MemoryGameLogic().difficulty_levels
+    for pool in (False, True):
+        root = tk.Tk()
+        root.geometry("600x600")
+        gui = MemoryGameGUI(root, levels)
+        gui.pool_widgets = pool
+        command = lambda *args: None
+        gui.setup_menu(command)
+        root.update()
+        for level, (rows, cols) in levels.items():
+            samples: List[float] = []
+            for _ in range(repeats):
+                gui.setup_menu(command)
+                root.update()
+                start = time.perf_counter()
+                gui.setup_board(rows, cols, command)
+                root.update()
+                samples.append((time.perf_counter() - start) * 1000)
+            _report(f"{'pool' if pool else 'rebuild'} {level} ({rows}x{cols})", samples)
+        root.destroy()
+
+
+def bench_clicks(games: int) -> None:
+    """Порівнює кількість викликів config (Tcl) і час кліку з чергою оновлень і без неї.
+
+    Кожна пара грається як промах, а потім влучання, тож у вимірі є і скидання карток.
+    Args:
+        games: Кількість ігор на рівні Hard для кожного режиму
+    """
+    from MemoryGameAudio import AudioManager
+    from MemoryGameController import MemoryGameController
+
+    for batch in (False, True):
+        root = tk.Tk()
+        root.geometry("600x600")
+        game = MemoryGameController(root)
+        game.audio = AudioManager(game.audio.sounds, enabled=False)
+        game.stats_enabled = False
+        game.gui.batch_updates = batch
+        game.gui.show_win_message = lambda *args: None
+        rows, cols = game.logic.difficulty_levels["Hard"]
+        clicks = 0
+        calls = 0
+        samples: List[float] = []
+        for _ in range(games):
+            game.start_game(rows, cols)
+            root.update()
+            positions: Dict[int, List[int]] = {}
+            for idx, symbol_id in enumerate(game.logic.symbol_ids):
+                positions.setdefault(symbol_id, []).append(idx)
+            pairs = [cards for cards in positions.values() if len(cards) == 2]
+            for number, (first, second) in enumerate(pairs):
+                wrong = pairs[(number + 1) % len(pairs)][0]
+                sequence = [first, wrong, first, second] if wrong != first and number + 1 < len(pairs) else [first, second]
+                for idx in sequence:
+                    before = game.gui.config_calls
+                    start = time.perf_counter()
+                    game.handle_click(idx)
+                    root.update()
+                    samples.append((time.perf_counter() - start) * 1000)
+                    calls += game.gui.config_calls - before
+                    clicks += 1
+        print(f"{'batched' if batch else 'direct':>8}: {calls / clicks:.2f} config/клік")
+        _report(f"{'batched' if batch else 'direct'} click+paint", samples)
+        root.destroy()
+
+
+def bench_startup(launches: int) -> None:
+    """Вимірює холодний старт гри: імпорти та час до першого кадру меню.
+
+    Кожен запуск - окремий процес `MemoryGameController.py --startup-probe`;
+    порівнюються звичайний швидкий старт і старт без відкладання звуку.
+    Args:
+        launches: Кількість запусків для кожного режиму
+    """
+    for mode, extra in (("eager audio", ["--no-fast-start"]), ("fast start", [])):
+        imports: List[float] = []
+        first_frames: List[float] = []
+        walls: List[float] = []
+        for _ in range(launches):
+            start = time.perf_counter()
+            output = subprocess.run(
+                [sys.executable, "MemoryGameController.py", "--startup-probe", *extra],
+                cwd=REPO_DIR, capture_output=True, text=True, check=True
+            ).stdout
+            walls.append((time.perf_counter() - start) * 1000)
+            line = next(line for line in output.splitlines() if line.startswith("STARTUP"))
+            values = dict(field.split("=") for field in line.split()[1:])
+            imports.append(float(values["import_ms"]))
+            first_frames.append(float(values["first_frame_ms"]))
+        _report(f"{mode} imports", imports, budget_ms=None)
+        _report(f"{mode} first menu frame", first_frames, budget_ms=None)
+        _report(f"{mode} process wall time", walls, budget_ms=None)
+
+
+def _probe(script: str, extra: List[str], use_pty: bool) -> Optional[Tuple[float, float, float]]:
+    """Запускає фронтенд з --startup-probe і повертає (перший кадр мс, весь процес мс, пікова RSS МіБ).
+
+    Термінальний фронтенд запускається в псевдотерміналі, бо curses потребує tty.
+    Повертає None, якщо фронтенд не вивів STARTUP (напр., Tk без дисплея).
+    """
+    command = [sys.executable, script, "--startup-probe", *extra]
+    start = time.perf_counter()
+    if use_pty:
+        import pty
+        pid, fd = pty.fork()
+        if pid == 0:
+            os.chdir(REPO_DIR)
+            os.environ.setdefault("TERM", "xterm-256color")
+            os.execv(sys.executable, command)
+        chunks = []
+        while True:
+            try:
+                chunk = os.read(fd, 65536)
+            except OSError:
+                break  # EIO: дочірній процес закрив термінал
+            if not chunk:
+                break
+            chunks.append(chunk)
+        os.close(fd)
+        output = b"".join(chunks).decode(errors="replace")
+    else:
+        process = subprocess.Popen(command, cwd=REPO_DIR, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        output = process.stdout.read().decode(errors="replace")
+        process.stdout.close()
+        pid = process.pid
+        process.returncode = 0  # Процес забирає os.wait4 нижче, Popen не повинен чекати на нього вдруге
+    _, _, usage = os.wait4(pid, 0)
+    wall = (time.perf_counter() - start) * 1000
+    line = next((line for line in output.splitlines() if "STARTUP" in line), None)
+    if line is None:
+        return None
+    values = dict(field.split("=") for field in line[line.index("STARTUP"):].split()[1:])
+    return float(values["first_frame_ms"]), wall, usage.ru_maxrss / 1024  # ru_maxrss у КіБ (Linux)
+
+
+def bench_frontends(launches: int, grid: Optional[str]) -> None:
+    """Порівнює старт і пам'ять Tk-фронтенду та термінального (curses).
+
+    Args:
+        launches: Кількість запусків кожного фронтенду
+        grid: Поле РЯДКИxСТОВПЦІ, з яким стартувати (None - головне меню)
+    """
+    extra = ["--grid", grid] if grid else []
+    frontends = (("tk", "MemoryGameController.py", ["--no-stats", *extra], False),
+                 ("curses", "MemoryGameCurses.py", extra, True))
+    for name, script, arguments, use_pty in frontends:
+        first_frames: List[float] = []
+        walls: List[float] = []
+        rss: List[float] = []
+        for _ in range(launches):
+            result = _probe(script, arguments, use_pty)
+            if result is None:
+                break
+            first_frame, wall, max_rss = result
+            first_frames.append(first_frame)
+            walls.append(wall)
+            rss.append(max_rss)
+        if not first_frames:
+            print(f"{name}: no display (front-end did not start), skipped")
+            continue
+        _report(f"{name} first frame", first_frames, budget_ms=None)
+        _report(f"{name} process wall time", walls, budget_ms=None)
+        print(f"{name + ' peak RSS':>28}: median={statistics.median(rss):7.1f} MiB  max={max(rss):7.1f} MiB")
+
+
+def bench_tiles(symbols: int, reveals: int) -> None:
+    """Порівнює малювання плиток, кеш у пам'яті й на диску та відкриття картки текстом і плиткою.
+
+    Args:
+        symbols: Кількість різних символів для малювання
+        reveals: Кількість відкриттів картки для кожного способу
+    """
+    import tempfile
+    from MemoryGameLogic import symbol_name
+    from MemoryGameSymbols import SymbolProvider
+
+    root = tk.Tk()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        provider = SymbolProvider(root, capacity=symbols, disk_cache_dir=cache_dir)
+        for name, source in (("render + PNG", provider), ("memory cache hit", provider),
+                             ("PNG disk cache", SymbolProvider(root, capacity=symbols, disk_cache_dir=cache_dir))):
+            samples = []
+            for symbol_id in range(symbols):
+                start = time.perf_counter()
+                source.get(symbol_id)
+                samples.append((time.perf_counter() - start) * 1000)
+            _report(f"tile {name}", samples)
+
+    # Відкриття картки: кожне нове відкриття показує інший символ, як у грі
+    card = tk.Button(root, font=("Arial", 14, "bold"), width=4, height=2)
+    card.pack()
+    tile_card = tk.Button(root, compound="center", width=provider.size, height=provider.size)
+    tile_card.pack()
+    root.update()
+    for name, reveal in (("emoji text", lambda i: card.config(text=symbol_name(i % symbols))),
+                         ("cached tile", lambda i: tile_card.config(image=provider.get(i % symbols)))):
+        samples = []
+        for i in range(reveals):
+            start = time.perf_counter()
+            reveal(i)
+            root.update_idletasks()
+            samples.append((time.perf_counter() - start) * 1000)
+        _report(f"reveal {name}", samples)
+    root.destroy()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Бенчмарки інтерфейсу Memory Game (потрібен X-сервер, напр. Xvfb)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    restart_parser = subparsers.add_parser("restart", help="Затримка перезапуску гри")
+    restart_parser.add_argument("--repeats", type=int, default=50)
+    clicks_parser = subparsers.add_parser("clicks", help="Виклики Tcl і час на клік")
+    clicks_parser.add_argument("--games", type=int, default=20)
+    startup_parser = subparsers.add_parser("startup", help="Час імпортів і до першого кадру меню")
+    startup_parser.add_argument("--launches", type=int, default=20)
+    frontends_parser = subparsers.add_parser("frontends", help="Старт і пам'ять: Tk проти curses")
+    frontends_parser.add_argument("--launches", type=int, default=10)
+    frontends_parser.add_argument("--grid", help="Поле РЯДКИxСТОВПЦІ (за замовчуванням - меню)")
+    tiles_parser = subparsers.add_parser("tiles", help="Плитки символів проти тексту з емодзі")
+    tiles_parser.add_argument("--symbols", type=int, default=500)
+    tiles_parser.add_argument("--reveals", type=int, default=2000)
+    args = parser.parse_args()
+
+    with virtual_display():
+        if args.command == "restart":
+            bench_restart(args.repeats)
+        elif args.command == "clicks":
+            bench_clicks(args.games)
+        elif args.command == "startup":
+            bench_startup(args.launches)
+        elif args.command == "frontends":
+            bench_frontends(args.launches, args.grid)
+        elif args.command == "tiles":
+            bench_tiles(args.symbols, args.reveals)
@@ -0,0 +1,279 @@
+import tkinter as tk
+from typing import Callable, Dict, Optional, Set, Tuple
+
+# Стани клітинок поля
+HIDDEN = 0  # Картка закрита
+REVEALED = 1  # Картка відкрита в поточному ході
+MATCHED = 2  # Картка в знайденій парі
+HINTED = 3  # Закрита картка, підсвічена підказкою
+
+# Байт бітової множини -> 8 байтів стану клітинок (MATCHED для встановлених бітів)
+_MATCHED_STATES = [bytes(MATCHED if bits >> bit & 1 else HIDDEN for bit in range(8)) for bits in range(256)]
+
+
+class CanvasBoard:
+    def __init__(self, master: tk.Misc, rows: int, cols: int, button_command: Callable,
+                 gui, cell_size: int = 56, gap: int = 6):
+        """Ігрове поле, намальоване на одному tk.Canvas.
+
+        Замість кнопки на кожну картку зберігає стан клітинок у компактних масивах
+        і створює елементи полотна лише для клітинок у видимій області.
+
+        Args:
+            master: Батьківський віджет
+            rows: Кількість рядків
+            cols: Кількість стовпців
+            button_command: Функція-обробник кліку на картку (отримує індекс)
+            gui: Об'єкт MemoryGameGUI, з якого беруться кольори та шрифт
+            cell_size: Розмір клітинки в пікселях
+            gap: Відступ між клітинками в пікселях
+        """
+        self.rows = rows
+        self.cols = cols
+        self.button_command = button_command
+        self.gui = gui
+        self.cell_size = cell_size
+        self.pitch = cell_size + gap  # Крок сітки: клітинка + відступ
+        self.gap = gap
+
+        self.states = bytearray(rows * cols)  # Стан кожної клітинки
+        self.texts: Dict[int, str] = {}  # Символи лише відкритих карток
+        self.symbol_ids: Dict[int, int] = {}  # Ідентифікатори символів відкритих карток (для плиток)
+        self.items: Dict[int, Tuple[int, int, int]] = {}  # Видимі клітинки: (прямокутник, текст, зображення)
+        self.item_images: Dict[int, tk.PhotoImage] = {}  # Посилання на плитки, показані у видимих клітинках
+        # Текст і символ карток, відновлених зі знімка, обчислюються на вимогу, а не зберігаються
+        self.label_of: Optional[Callable[[int], Tuple[str, Optional[int]]]] = None
+        self.visible: Tuple[int, int, int, int] = (0, 0, 0, 0)  # Видимі рядки/стовпці [r0, r1) x [c0, c1)
+        self.dirty: Set[int] = set()  # Клітинки, які треба перемалювати
+        self._flush_pending = False
+        self._viewport_pending = False
+
+        width = cols * self.pitch + gap
+        height = rows * self.pitch + gap
+
+        self.frame = tk.Frame(master, bg=gui.bg_color)
+        self.canvas = tk.Canvas(
+            self.frame,
+            width=min(width, 560),
+            height=min(height, 460),
+            bg=gui.bg_color,
+            highlightthickness=0,
+            scrollregion=(0, 0, width, height),
+            xscrollcommand=self._on_xscroll,
+            yscrollcommand=self._on_yscroll
+        )
+        self.vbar = tk.Scrollbar(self.frame, orient="vertical", command=self.canvas.yview)
+        self.hbar = tk.Scrollbar(self.frame, orient="horizontal", command=self.canvas.xview)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.vbar.grid(row=0, column=1, sticky="ns")
+        self.hbar.grid(row=1, column=0, sticky="ew")
+        self.frame.rowconfigure(0, weight=1)
+        self.frame.columnconfigure(0, weight=1)
+
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<Configure>", lambda e: self._schedule_viewport())
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))
+
+    def grid(self, **kwargs) -> None:
+        """Розміщує поле в батьківському віджеті (як звичайний віджет)."""
+        self.frame.grid(**kwargs)
+
+    def reset(self, button_command: Callable) -> None:
+        """Повертає всі картки в початковий стан для нової гри того ж розміру.
+
+        Args:
+            button_command: Новий обробник кліку на картку
+        """
+        self.button_command = button_command
+        self.dirty.update(idx for idx in self.items if self.states[idx] != HIDDEN)
+        self.states = bytearray(self.rows * self.cols)
+        self.texts.clear()
+        self.symbol_ids.clear()
+        self.label_of = None
+        self.canvas.xview_moveto(0)
+        self.canvas.yview_moveto(0)
+        if self.dirty and not self._flush_pending:
+            self._flush_pending = True
+            self.canvas.after_idle(self._flush)
+
+    def restore_matched(self, matched: bytes, label_of: Callable[[int], Tuple[str, Optional[int]]]) -> None:
+        """Позначає знайдені картки з бітової множини одним проходом по байтах.
+
+        Args:
+            matched: Бітова множина знайдених карток
+            label_of: Функція індекс -> (текст символу, ідентифікатор символу)
+        """
+        self.states = bytearray(b"".join(_MATCHED_STATES[bits] for bits in matched)[:self.rows * self.cols])
+        self.label_of = label_of
+        self.dirty.update(self.items)
+        if self.dirty and not self._flush_pending:
+            self._flush_pending = True
+            self.canvas.after_idle(self._flush)
+
+    def cell_at(self, x: float, y: float) -> Optional[int]:
+        """Визначає індекс картки за координатами на полотні.
+
+        Args:
+            x: Координата x на полотні
+            y: Координата y на полотні
+        Returns:
+            Optional[int]: Індекс картки або None, якщо клік поза карткою
+        """
+        col, dx = divmod(int(x) - self.gap, self.pitch)
+        row, dy = divmod(int(y) - self.gap, self.pitch)
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return None
+        if dx >= self.cell_size or dy >= self.cell_size:
+            return None  # Клік у проміжок між картками
+        return row * self.cols + col
+
+    def update_cell(self, idx: int, state: int, text: str = "", symbol_id: Optional[int] = None) -> None:
+        """Змінює стан картки; перемальовується лише ця клітинка і лише якщо вона видима.
+
+        Args:
+            idx: Індекс картки
+            state: Новий стан (HIDDEN, REVEALED або MATCHED)
+            text: Символ на картці
+            symbol_id: Ідентифікатор символу для плитки-зображення
+        """
+        self.states[idx] = state
+        if state in (HIDDEN, HINTED):
+            self.texts.pop(idx, None)
+            self.symbol_ids.pop(idx, None)
+        else:
+            self.texts[idx] = text
+            if symbol_id is not None:
+                self.symbol_ids[idx] = symbol_id
+        if idx in self.items:
+            self.dirty.add(idx)
+            if not self._flush_pending:
+                self._flush_pending = True
+                self.canvas.after_idle(self._flush)
+
+    def reveal_cell(self, idx: int, text: str, matched: bool = False, symbol_id: Optional[int] = None) -> None:
+        """Відкриває картку (або позначає її знайденою)."""
+        self.update_cell(idx, MATCHED if matched else REVEALED, text, symbol_id)
+
+    def hide_cell(self, idx: int) -> None:
+        """Закриває картку."""
+        self.update_cell(idx, HIDDEN)
+
+    def hint_cell(self, idx: int) -> None:
+        """Підсвічує закриту картку й прокручує поле так, щоб її було видно."""
+        self.update_cell(idx, HINTED)
+        row, col = divmod(idx, self.cols)
+        width = self.cols * self.pitch + self.gap
+        height = self.rows * self.pitch + self.gap
+        self.canvas.xview_moveto(max(0.0, (col * self.pitch - self.canvas.winfo_width() / 2) / width))
+        self.canvas.yview_moveto(max(0.0, (row * self.pitch - self.canvas.winfo_height() / 2) / height))
+
+    def _cell_style(self, idx: int) -> Tuple[str, str, str]:
+        """Кольори заливки, тексту та сам текст клітинки."""
+        state = self.states[idx]
+        if state == HIDDEN:
+            return self.gui.card_bg, self.gui.card_fg, "?"
+        if state == HINTED:
+            return self.gui.hint_color, self.gui.card_fg, "?"
+        text = self.texts.get(idx)
+        if text is None:
+            text = self.label_of(idx)[0] if self.label_of else ""
+        if state == MATCHED:
+            return self.gui.disabled_color, "white", text
+        return self.gui.highlight_color, "black", text
+
+    def _cell_image(self, idx: int) -> Optional[tk.PhotoImage]:
+        """Плитка символу відкритої клітинки, якщо GUI малює символи зображеннями."""
+        provider = self.gui.symbol_provider
+        if provider is None or self.states[idx] in (HIDDEN, HINTED):
+            return None
+        symbol_id = self.symbol_ids.get(idx)
+        if symbol_id is None and self.label_of and idx not in self.texts:
+            symbol_id = self.label_of(idx)[1]
+        if symbol_id is None:
+            return None
+        return provider.get(symbol_id)
+
+    def _apply_style(self, idx: int, items: Tuple[int, int, int]) -> None:
+        """Задає кольори, текст і плитку вже створеним елементам клітинки."""
+        fill, fg, text = self._cell_style(idx)
+        image = self._cell_image(idx)
+        self.canvas.itemconfig(items[0], fill=fill)
+        self.canvas.itemconfig(items[1], fill=fg, text="" if image else text)
+        self.canvas.itemconfig(items[2], image=image or "")
+        # Полотно не тримає посилання на PhotoImage, тож плитка видимої клітинки зберігається тут
+        if image:
+            self.item_images[idx] = image
+        else:
+            self.item_images.pop(idx, None)
+
+    def _flush(self) -> None:
+        """Перемальовує лише змінені видимі клітинки."""
+        self._flush_pending = False
+        for idx in self.dirty:
+            items = self.items.get(idx)
+            if items is not None:
+                self._apply_style(idx, items)
+        self.dirty.clear()
+
+    def _draw_cell(self, idx: int) -> None:
+        """Створює елементи полотна для клітинки, що стала видимою."""
+        row, col = divmod(idx, self.cols)
+        x = self.gap + col * self.pitch
+        y = self.gap + row * self.pitch
+        fill, fg, text = self._cell_style(idx)
+        image = self._cell_image(idx)
+        rect = self.canvas.create_rectangle(x, y, x + self.cell_size, y + self.cell_size,
+                                            fill=fill, outline="")
+        label = self.canvas.create_text(x + self.cell_size // 2, y + self.cell_size // 2,
+                                        text="" if image else text, fill=fg, font=self.gui.card_font)
+        tile = self.canvas.create_image(x + self.cell_size // 2, y + self.cell_size // 2, image=image or "")
+        if image:
+            self.item_images[idx] = image
+        self.items[idx] = (rect, label, tile)
+
+    def _schedule_viewport(self) -> None:
+        if not self._viewport_pending:
+            self._viewport_pending = True
+            self.canvas.after_idle(self._refresh_viewport)
+
+    def _refresh_viewport(self) -> None:
+        """Матеріалізує клітинки, що потрапили у видиму область, і видаляє решту."""
+        self._viewport_pending = False
+        left = self.canvas.canvasx(0)
+        top = self.canvas.canvasy(0)
+        right = left + self.canvas.winfo_width()
+        bottom = top + self.canvas.winfo_height()
+        r0 = max(0, int(top) // self.pitch)
+        r1 = min(self.rows, int(bottom) // self.pitch + 1)
+        c0 = max(0, int(left) // self.pitch)
+        c1 = min(self.cols, int(right) // self.pitch + 1)
+        if (r0, r1, c0, c1) == self.visible:
+            return
+        self.visible = (r0, r1, c0, c1)
+
+        for idx in [i for i in self.items if not (r0 <= i // self.cols < r1 and c0 <= i % self.cols < c1)]:
+            self.canvas.delete(*self.items.pop(idx))
+            self.item_images.pop(idx, None)
+        for row in range(r0, r1):
+            for col in range(c0, c1):
+                idx = row * self.cols + col
+                if idx not in self.items:
+                    self._draw_cell(idx)
+
+    def _on_xscroll(self, first: str, last: str) -> None:
+        self.hbar.set(first, last)
+        self._schedule_viewport()
+
+    def _on_yscroll(self, first: str, last: str) -> None:
+        self.vbar.set(first, last)
+        self._schedule_viewport()
+
+    def _on_wheel(self, event: tk.Event) -> None:
+        self.canvas.yview_scroll(-1 if event.delta > 0 else 1, "units")
+
+    def _on_click(self, event: tk.Event) -> None:
+        idx = self.cell_at(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+        if idx is not None:
+            self.button_command(idx)
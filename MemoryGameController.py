@@ -1,93 +1,430 @@
+import time
+_START_TIME = time.perf_counter()  # Момент початку імпортів (для вимірювання швидкості старту)
+
 import tkinter as tk
-from MemoryGameLogic import MemoryGameLogic
+from collections import deque
+from MemoryGameLogic import MemoryGameLogic, BLANK_ID, symbol_name
 from MemoryGameGUI import MemoryGameGUI
-from typing import Optional, Tuple
-import pygame
+from MemoryGameAudio import AudioManager
+from MemoryGameKnowledge import KnowledgeTracker
+from MemoryGameProfiler import ClickProfiler
+from MemoryGameSolver import par_for_grid
+from MemoryGameTurns import TurnFlow
+from typing import Callable, Deque, Dict, Optional, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from MemoryGameRecorder import GameRecorder
+    from MemoryGameSnapshot import Snapshot, SnapshotWriter
+    from MemoryGameStats import StatsStore
+
+_IMPORTS_DONE = time.perf_counter()  # Момент завершення імпортів
+
+
+class AfterScheduler:
+    def __init__(self, root: tk.Misc):
+        """Обгортка над root.after, яка пам'ятає заплановані виклики, щоб їх можна було скасувати.
+        Args:
+            root: Віджет, через який плануються виклики
+        """
+        self.root = root
+        self.handles: Set[str] = set()  # Ідентифікатори запланованих, але ще не виконаних викликів
+
+    def schedule(self, delay_ms: int, callback: Callable, *args) -> str:
+        """Планує виклик callback(*args) через delay_ms та повертає його ідентифікатор."""
+        def run() -> None:
+            self.handles.discard(handle)
+            callback(*args)
+
+        handle = self.root.after(delay_ms, run)
+        self.handles.add(handle)
+        return handle
+
+    def cancel(self, handle: Optional[str]) -> None:
+        """Скасовує виклик, якщо він ще не виконався."""
+        if handle in self.handles:
+            self.handles.discard(handle)
+            self.root.after_cancel(handle)
+
+    def cancel_all(self) -> None:
+        """Скасовує всі заплановані виклики (нова гра, вихід у меню)."""
+        for handle in self.handles:
+            self.root.after_cancel(handle)
+        self.handles.clear()
+
 
 class MemoryGameController:
-    def __init__(self, root: tk.Tk):
-        """Ініціалізація контролера гри, який зв'язує логіку та GUI."""
+    def __init__(self, root: tk.Tk, fast_start: bool = True):
+        """Ініціалізація контролера гри, який зв'язує логіку та GUI.
+        Args:
+            root: Головне вікно програми
+            fast_start: Відкласти запуск звуку (імпорт pygame) до появи першого кадру меню
+        """
         self.root = root
         self.logic = MemoryGameLogic()  # Об'єкт логіки гри
         self.gui = MemoryGameGUI(root, self.logic.difficulty_levels)  # Об'єкт інтерфейсу
-        self.pending_reset: Optional[Tuple[int, int]] = None  # Пара карток для скидання
+        self.profiler = ClickProfiler(root)  # Профілювання шляху кліку (вмикається прапорцем --profile)
+        # Спільний з терміналом перебіг ходу; його етапи міряє той самий профайлер
+        self.turns = TurnFlow(self.logic, self.gui, self.profiler.stage)
+        self.scheduler = AfterScheduler(root)  # Таймери скидання, які скасовуються при новій грі
+        self.reset_handle: Optional[str] = None  # Таймер скидання turns.pending_reset
+        self.reset_delay_ms: int = 500  # Скільки показувати невдалу пару
+        # Швидкий режим: невдала пара одразу закривається в логіці й не блокує кліки, а на екрані
+        # кожна картка ховається за власним таймером (кілька пар можуть бути видимі одночасно)
+        self.fast_flip: bool = False
+        self.in_flight: Dict[int, str] = {}  # Картка, ще видима після промаху -> таймер її закриття
+        self.click_queue: Deque[int] = deque()  # Кліки, що надійшли під час обробки попереднього
+        self.handling_click: bool = False
+        self.recorder: Optional["GameRecorder"] = None  # Запис ігор у журнал (якщо увімкнено)
+        self.recording: bool = False  # Чи пишеться поточна гра (відновлена зі знімка - ні)
+        self.autosave: Optional["SnapshotWriter"] = None  # Автозбереження після кожного кліку
+        self.stats: Optional["StatsStore"] = None  # Сховище статистики (створюється при першій перемозі)
+        self.stats_enabled: bool = True  # Чи зберігати завершені ігри в статистику
+        self.game_started_at: float = 0.0  # Момент початку поточної гри (time.monotonic)
+        # Пам'ять про всі відкриті картки: для підказки та комп'ютерного суперника
+        self.knowledge = KnowledgeTracker()
+        self.hint_ms: int = 1000  # Скільки підсвічувати картку-підказку
+        self.vs_computer: bool = False  # Гра вдвох: гравець (0) проти комп'ютера (1)
+        self.current_player: int = 0
+        self.scores = [0, 0]  # Знайдені пари кожного гравця
+        self.computer_delay_ms: int = 700  # Пауза перед кожним відкриттям картки комп'ютером
 
-        # Ініціалізація звукових ефектів
-        pygame.mixer.init()
-        self.click_sound = pygame.mixer.Sound("sounds/click.wav")  # Звук кліку
-        self.match_sound = pygame.mixer.Sound("sounds/match.wav")  # Звук знаходження пари
-        self.win_sound = pygame.mixer.Sound("sounds/win.wav")  # Звук перемоги
+        # Звукові ефекти: мікшер і семпли готуються у фоні, меню не чекає на них
+        self.audio = AudioManager(
+            {
+                "click": "sounds/click.wav",  # Звук кліку
+                "match": "sounds/match.wav",  # Звук знаходження пари
+                "win": "sounds/win.wav",  # Звук перемоги
+            },
+            channels={"click": 4, "match": 2, "win": 1},
+            start=not fast_start
+        )
 
-        # Налаштування стартового меню
+        # Налаштування стартового меню; par рівнів (розв'язувач і його кеш на диску)
+        # рахується вже після першого кадру
+        self.gui.hint_command = self.show_hint
+        self.gui.menu_command = self.show_menu
         self.gui.setup_menu(self.start_game)
+        self.root.after_idle(self._show_level_par)
+        if fast_start:
+            # Фоновий імпорт pygame конкурує за GIL, тож стартуємо його вже після першого кадру
+            self.root.after_idle(self.audio.start)
+
+    def _show_level_par(self) -> None:
+        """Рахує par для кожного рівня й показує його в меню."""
+        self.gui.set_level_par({level: par_for_grid(rows, cols)
+                                for level, (rows, cols) in self.logic.difficulty_levels.items()})
 
     def start_game(self, rows: int, cols: int) -> None:
         """Почати нову гру з заданими розмірами сітки."""
         self.logic.setup_game(rows, cols)
         self.logic.moves = 0  # Скидання лічильника ходів
+        self._reset_turn_state()
+        self.game_started_at = time.monotonic()
+        self.recording = self.recorder is not None
+        if self.recorder:
+            self.recorder.start_game(rows, cols, self.logic.seed)
         self.gui.setup_board(rows, cols, self.handle_click)  # Створення ігрового поля
-        self.gui.update_moves(0)  # Оновлення лічильника ходів
+        self._warm_symbols()
+        self.turns.begin()  # Порожня картка й лічильник ходів
+        self.knowledge.reset(self.logic)
+        self._start_players()
+        if self.autosave:
+            self.autosave.start_game(self.logic)
+            self.autosave.save(self.logic, 0.0)
+
+    def resume_game(self, snapshot: "Snapshot") -> None:
+        """Продовжити гру зі знімка автозбереження (без тасування і повтору ходів)."""
+        snapshot.restore_into(self.logic)
+        self._reset_turn_state()
+        self.game_started_at = time.monotonic() - snapshot.elapsed
+        self.recording = False  # У журналі немає початку цієї гри, тож її кліки не відтворити
+        self.gui.setup_board(snapshot.rows, snapshot.cols, self.handle_click)
+        self._warm_symbols()
+        symbol_ids = self.logic.symbol_ids
+
+        def label_of(idx: int) -> Tuple[str, Optional[int]]:
+            symbol_id = symbol_ids[idx]
+            return (symbol_name(symbol_id), None if symbol_id == BLANK_ID else symbol_id)
+
+        self.gui.restore_matched(self.logic.matched, label_of)
+        if self.logic.first_index is not None:
+            first = self.logic.first_index
+            self.gui.update_button(first, self.logic.first_symbol, symbol_id=symbol_ids[first])
+        self.gui.update_moves(self.logic.moves)
+        self.knowledge.reset(self.logic)  # Відкрита перша картка ходу вважається побаченою
+        self._start_players()  # Рахунок у знімку не зберігається: відновлена гра рахується заново
+        if self.autosave:
+            self.autosave.start_game(self.logic)
+
+    def _warm_symbols(self) -> None:
+        """Домальовує плитки символів поля наперед (лише з плитками).
+
+        Ідентифікатори збираються, доки не заповниться кеш плиток, тож на великому
+        полі переглядаються лише перші кілька сотень карток, а не всі.
+        """
+        if not self.gui.use_tiles:
+            return
+        capacity = self.gui.symbol_provider.capacity
+        distinct: Dict[int, None] = {}  # Впорядкована множина
+        for symbol_id in self.logic.symbol_ids:
+            if symbol_id != BLANK_ID:
+                distinct[symbol_id] = None
+                if len(distinct) >= capacity:
+                    break
+        self.gui.prepare_symbols(distinct)
+
+    def show_menu(self) -> None:
+        """Вихід у меню з гри.
+
+        Таймери скидання, підказки та ходу комп'ютера зупиняються, інакше вони
+        продовжували б гру на прихованому полі.
+        """
+        self._reset_turn_state()
+        self.current_player = 0
+        self.gui.setup_menu(self.start_game)
+
+    def _reset_turn_state(self) -> None:
+        """Скасовує таймери й чергу кліків попередньої гри."""
+        self.scheduler.cancel_all()  # Таймери попередньої гри не повинні торкатися нового поля
+        self.turns.pending_reset = None
+        self.reset_handle = None
+        self.in_flight.clear()
+        self.click_queue.clear()
 
     def handle_click(self, idx: int) -> None:
-        """Обробник кліку на картку."""
-        button_text = self.gui.buttons[idx]["text"]
+        """Обробник кліку на картку.
+
+        Кліки ставляться в чергу й обробляються строго по порядку; клік, що надійшов
+        під час обробки попереднього (повторний вхід з циклу подій), не губиться.
+        """
+        if self.current_player == 1:
+            return  # Хід комп'ютера: кліки гравця ігноруються
+        self._enqueue_click(idx)
+
+    def _enqueue_click(self, idx: int) -> None:
+        """Ставить клік (гравця або комп'ютера) в чергу й обробляє чергу."""
+        self.click_queue.append(idx)
+        if self.handling_click:
+            return
+        self.handling_click = True
+        try:
+            while self.click_queue:
+                self._process_click(self.click_queue.popleft())
+        finally:
+            self.handling_click = False
+
+    def _process_click(self, idx: int) -> None:
+        """Обробляє один клік з черги."""
+        profiler = self.profiler
+        profiler.click_started()
+        with profiler.stage("click"):
+            if self.recording:
+                self.recorder.record_click(idx)
+            # Якщо є пара карток, які потребують скидання
+            if self.turns.pending_reset:
+                with profiler.stage("reset_turn"):
+                    self.scheduler.cancel(self.reset_handle)
+                    self.turns.reset_pending()
+            if idx in self.in_flight:
+                # Картка ще видима після промаху, але в логіці вже закрита - її відкривають знову
+                self.scheduler.cancel(self.in_flight.pop(idx))
+
+            # Відтворення звуку кліку
+            with profiler.stage("sound"):
+                self.audio.play("click")
+
+            # Клік у логіці гри та на полі (пара позначається знайденою, промах лишається відкритим);
+            # етапи logic.handle_click, gui.update_button і gui.update_moves міряються всередині
+            is_match, first_index, symbol = self.turns.flip(idx, hold_mismatch=not self.fast_flip)
 
-        # Якщо є пара карток, які потребують скидання
-        if self.pending_reset:
-            idx1, idx2 = self.pending_reset
-            self.reset_turn(idx1, idx2)
-            self.pending_reset = None
+            if symbol:
+                with profiler.stage("knowledge"):
+                    self.knowledge.observe(idx, self.logic.symbol_ids[idx])
+                    if is_match:
+                        self.knowledge.matched(idx, first_index)
 
-        # Відтворення звуку кліку
-        self.click_sound.play()
+            if self.vs_computer and first_index is not None:
+                # Пара - той самий гравець ходить знову, промах - хід переходить до суперника
+                # (рахунок оновлюється до перевірки перемоги, щоб остання пара потрапила в підсумок)
+                if is_match:
+                    self.scores[self.current_player] += 1
+                else:
+                    self.current_player ^= 1
+                self._update_players()
 
-        # Обробка кліку в логіці гри
-        is_match, first_index, symbol = self.logic.handle_click(idx, button_text)
+            if is_match:
+                with profiler.stage("sound"):
+                    self.audio.play("match")  # Звук знаходження пари
 
-        if symbol:
-            self.gui.update_button(idx, symbol)  # Оновлення вигляду картки
+                # Перевірка перемоги (лічильник пар у логіці, без обходу кнопок)
+                if self.logic.check_win():
+                    self.audio.play("win")  # Звук перемоги
+                    if self.recording:
+                        self.recorder.flush()
+                    if self.autosave:
+                        self.autosave.discard()  # Завершену гру продовжувати нічого
+                    self.record_stats()
+                    self.turns.announce_win(self.scores if self.vs_computer else None)
 
-        if is_match:
-            # Якщо знайдено пару
-            self.gui.update_button(idx, symbol, True)
-            self.gui.update_button(self.logic.first_index, self.logic.first_symbol, True)
-            self.logic.first_symbol = None
-            self.logic.first_index = None
-            self.logic.reset_turn()
+            elif first_index is not None and self.fast_flip:
+                # Швидкий режим: хід уже завершено, картки ховаються кожна за своїм таймером
+                for card in (idx, first_index):
+                    self.in_flight[card] = self.scheduler.schedule(self.reset_delay_ms, self.hide_card, card)
 
-            self.match_sound.play()  # Звук знаходження пари
+            elif first_index is not None:
+                # Пару не знайдено: turns.pending_reset закриється за таймером або наступним кліком
+                self.reset_handle = self.scheduler.schedule(self.reset_delay_ms, self.check_and_reset_pending)
 
-            # Перевірка перемоги
-            buttons_state = [btn["state"] for btn in self.gui.buttons]
-            if self.logic.check_win(buttons_state):
-                self.win_sound.play()  # Звук перемоги
-                self.gui.update_moves(self.logic.moves)
-                self.gui.show_win_message(self.logic.moves)
+            if self.vs_computer and self.current_player == 1 and symbol and not self.logic.check_win():
+                self.scheduler.schedule(self.computer_delay_ms, self._computer_move)
 
-        elif first_index is not None:
-            # Якщо пару не знайдено, запам'ятовуємо картки для скидання
-            self.pending_reset = (idx, first_index)
-            self.root.after(500, lambda: self.check_and_reset_pending())
+            if symbol and self.autosave and not self.logic.check_win():
+                with profiler.stage("autosave"):
+                    self.autosave.save(self.logic, time.monotonic() - self.game_started_at)
 
-        self.gui.update_moves(self.logic.moves)  # Оновлення лічильника ходів
+    def show_hint(self) -> None:
+        """Підсвічує картку, яку варто відкрити наступною (за пам'яттю про всі відкриті картки)."""
+        if self.current_player == 1 or self.logic.check_win():
+            return
+        # Невдалу пару закриваємо одразу, як це зробив би наступний клік, - підказка може вказати на неї
+        if self.turns.pending_reset:
+            self.scheduler.cancel(self.reset_handle)
+            self.check_and_reset_pending()
+        idx = self.knowledge.best_move(self.logic.first_index)
+        if idx is not None:
+            self.gui.show_hint(idx)
+            self.scheduler.schedule(self.hint_ms, self._clear_hint, idx)
+
+    def _clear_hint(self, idx: int) -> None:
+        """Знімає підсвічування, якщо картку за цей час не відкрили."""
+        if not (self.logic.is_revealed(idx) or self.logic.is_matched(idx) or idx in self.in_flight):
+            self.gui.reset_button(idx)
+
+    def _start_players(self) -> None:
+        """Скидає рахунок гри вдвох (гравець починає)."""
+        self.current_player = 0
+        self.scores = [0, 0]
+        self._update_players()
+
+    def _update_players(self) -> None:
+        if not self.vs_computer:
+            self.gui.update_players("")
+            return
+        turn = "your turn" if self.current_player == 0 else "computer's turn"
+        self.gui.update_players(f"You {self.scores[0]} : {self.scores[1]} CPU · {turn}")
+
+    def _computer_move(self) -> None:
+        """Комп'ютер відкриває одну картку за найкращим ходом з пам'яті."""
+        if self.current_player != 1 or self.logic.check_win():
+            return
+        idx = self.knowledge.best_move(self.logic.first_index)
+        if idx is not None:
+            self._enqueue_click(idx)
+
+    def record_stats(self) -> None:
+        """Ставить завершену гру в чергу сховища статистики (запис на диск - у фоновому потоці)."""
+        if not self.stats_enabled or self.vs_computer:
+            return  # Ходи гри вдвох не порівнянні з одиночною статистикою
+        if self.stats is None:
+            from MemoryGameStats import StatsStore
+            self.stats = StatsStore()
+        grid = (self.logic.rows, self.logic.cols)
+        difficulty = next((level for level, size in self.logic.difficulty_levels.items() if size == grid),
+                          "Custom")
+        self.stats.record_game(difficulty, self.logic.rows, self.logic.cols, self.logic.moves,
+                               time.monotonic() - self.game_started_at, self.logic.seed)
 
     def check_and_reset_pending(self) -> None:
         """Скинути пару карток, якщо вони все ще потребують скидання"""
-        if self.pending_reset:
-            idx1, idx2 = self.pending_reset
-            self.reset_turn(idx1, idx2)
-            self.pending_reset = None
+        self.reset_handle = None
+        if self.turns.pending_reset:
+            with self.profiler.stage("after_reset"):
+                self.turns.reset_pending()
+
+    def hide_card(self, idx: int) -> None:
+        """Закриває картку невдалої пари на екрані (швидкий режим; логіка вже скинута)."""
+        if self.in_flight.pop(idx, None) is not None:
+            self.gui.reset_button(idx)
 
-    def reset_turn(self, idx1: int, idx2: int) -> None:
-        """Скинути дві картки після невдалої спроби знайти пару"""
-        self.gui.reset_button(idx1)
-        self.gui.reset_button(idx2)
-        self.logic.reset_turn()
+
+def _report_first_frame(root: tk.Tk) -> None:
+    """Друкує час імпортів і час до першого кадру меню та закриває вікно (режим --startup-probe)."""
+    root.update_idletasks()
+    first_frame = time.perf_counter()
+    print(f"STARTUP import_ms={(_IMPORTS_DONE - _START_TIME) * 1000:.2f} "
+          f"first_frame_ms={(first_frame - _START_TIME) * 1000:.2f}", flush=True)
+    root.destroy()
 
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Memory Game")
+    parser.add_argument("--grid", help="Одразу почати гру на полі РЯДКИxСТОВПЦІ, напр. 100x100")
+    parser.add_argument("--renderer", choices=["auto", "buttons", "canvas"], default="auto",
+                        help="Спосіб малювання поля: кнопки, полотно або автоматично за розміром")
+    parser.add_argument("--tiles", action="store_true",
+                        help="Показувати символи заздалегідь намальованими плитками замість емодзі")
+    parser.add_argument("--tile-size", type=int, default=44, help="Розмір плитки символу в пікселях")
+    parser.add_argument("--tile-theme", choices=["default", "high-contrast"], default="default",
+                        help="Палітра плиток")
+    parser.add_argument("--tile-cache", metavar="DIR", help="Каталог дискового кешу плиток (PNG)")
+    parser.add_argument("--fast-flip", action="store_true",
+                        help="Не блокувати кліки після промаху: невдалі пари ховаються самі за таймером")
+    parser.add_argument("--vs-computer", action="store_true",
+                        help="Гра вдвох проти комп'ютера з ідеальною пам'яттю")
+    parser.add_argument("--no-fast-start", action="store_true",
+                        help="Запускати звук одразу, не чекаючи першого кадру меню")
+    parser.add_argument("--startup-probe", action="store_true",
+                        help="Вивести час до першого кадру меню й вийти (для бенчмарку старту)")
+    parser.add_argument("--record", metavar="PATH", help="Дописувати всі ігри в бінарний журнал")
+    parser.add_argument("--no-stats", action="store_true", help="Не зберігати статистику ігор")
+    parser.add_argument("--no-autosave", action="store_true",
+                        help="Не зберігати незавершену гру й не продовжувати збережену")
+    parser.add_argument("--profile", action="store_true",
+                        help="Вимірювати затримки кліку; F3 - накладка з показниками")
+    parser.add_argument("--profile-trace", metavar="PATH",
+                        help="Записати трасування (Chrome Trace JSON) при виході; вмикає --profile")
+    args = parser.parse_args()
+
     root = tk.Tk()
     root.geometry("600x600")
     root.config(bg="#f0f0f0")
-    game = MemoryGameController(root)
-    root.mainloop()
\ No newline at end of file
+    game = MemoryGameController(root, fast_start=not args.no_fast_start)
+    game.gui.renderer = args.renderer
+    game.gui.use_tiles = args.tiles
+    game.gui.tile_size = args.tile_size
+    game.gui.tile_theme = args.tile_theme
+    game.gui.tile_cache_dir = args.tile_cache
+    game.stats_enabled = not args.no_stats
+    game.fast_flip = args.fast_flip
+    game.vs_computer = args.vs_computer
+    if args.profile or args.profile_trace:
+        game.profiler.enabled = True
+        game.profiler.trace_path = args.profile_trace
+        game.profiler.start_loop_probe()
+        root.bind("<F3>", game.profiler.toggle_hud)
+    if args.record:
+        from MemoryGameRecorder import GameRecorder
+        game.recorder = GameRecorder(args.record)
+    if args.startup_probe:
+        root.after_idle(_report_first_frame, root)
+    snapshot = None
+    if not args.no_autosave and not args.startup_probe:
+        from MemoryGameSnapshot import SnapshotWriter, load_snapshot
+        game.autosave = SnapshotWriter()
+        snapshot = load_snapshot(game.autosave.path)
+    if args.grid:
+        grid_rows, grid_cols = (int(value) for value in args.grid.lower().split("x"))
+        game.start_game(grid_rows, grid_cols)
+    elif snapshot:
+        game.resume_game(snapshot)
+    root.mainloop()
+    if game.autosave:
+        game.autosave.close()
+    if game.recorder:
+        game.recorder.close()
+    if game.stats:
+        game.stats.close()
+    if game.profiler.enabled:
+        print(game.profiler.summary())
+        game.profiler.dump()
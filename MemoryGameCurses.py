@@ -0,0 +1,322 @@
+import time
+_START_TIME = time.perf_counter()  # Момент початку імпортів (для вимірювання швидкості старту)
+
+import curses
+import locale
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from MemoryGameLogic import MemoryGameLogic, BLANK_ID, EMOJI_SYMBOLS
+from MemoryGameSolver import par_for_grid
+from MemoryGameTurns import TurnFlow
+
+_IMPORTS_DONE = time.perf_counter()  # Момент завершення імпортів
+
+# Стани клітинок поля (як у MemoryGameCanvas, але без залежності від tkinter)
+HIDDEN = 0  # Картка закрита
+REVEALED = 1  # Картка відкрита в поточному ході
+MATCHED = 2  # Картка в знайденій парі
+
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+_MOVES = {curses.KEY_UP: (-1, 0), curses.KEY_DOWN: (1, 0), curses.KEY_LEFT: (0, -1), curses.KEY_RIGHT: (0, 1),
+          ord("k"): (-1, 0), ord("j"): (1, 0), ord("h"): (0, -1), ord("l"): (0, 1)}
+BOARD_TOP = 2  # Рядок екрана, з якого починається поле (над ним - лічильник і підказка)
+HELP = "arrows/hjkl - move, space/enter - flip, n - new game, m - menu, q - quit"
+
+
+def ascii_label(symbol_id: int) -> str:
+    """Позначка символу латиницею й цифрами (для терміналів без emoji)."""
+    if symbol_id == BLANK_ID:
+        return ""
+    text = ""
+    while True:
+        symbol_id, digit = divmod(symbol_id, len(_DIGITS))
+        text = _DIGITS[digit] + text
+        if not symbol_id:
+            return text
+
+
+class CursesView:
+    def __init__(self, screen: "curses.window", ascii_symbols: bool = False):
+        """Термінальне подання гри з тими ж методами, що й MemoryGameGUI.
+
+        Стан клітинок зберігається в bytearray, а на екран перемальовуються лише
+        змінені клітинки (і лише видимі), тож клік коштує кілька викликів curses
+        незалежно від розміру поля. Великі поля прокручуються за курсором.
+        Args:
+            screen: Головне вікно curses
+            ascii_symbols: Показувати символи латиницею замість emoji
+        """
+        self.screen = screen
+        self.ascii_symbols = ascii_symbols
+        self.rows = 0
+        self.cols = 0
+        self.states = bytearray()  # Стан кожної клітинки
+        self.labels: Dict[int, str] = {}  # Текст лише відкритих карток
+        self.cell_width = 4  # Ширина клітинки в колонках терміналу (разом із проміжком)
+        self.cursor = 0  # Індекс картки під курсором
+        self.top = 0  # Перший видимий рядок поля
+        self.left = 0  # Перший видимий стовпець поля
+        self.dirty: Set[int] = set()  # Клітинки, які треба перемалювати
+        self.full_redraw = True  # Перемалювати все (нове поле, прокрутка, зміна розміру терміналу)
+        self.status = ""  # Рядок над полем
+        self.message = HELP  # Нижній рядок: підказка з клавішами або повідомлення про перемогу
+        self.button_command: Optional[Callable[[int], None]] = None
+        self.cells_drawn = 0  # Лічильник намальованих клітинок для вимірювань
+
+        curses.curs_set(0)
+        self.colors: Tuple[int, int, int] = (curses.A_BOLD, curses.A_STANDOUT, curses.A_DIM)
+        if curses.has_colors():
+            curses.start_color()
+            curses.init_pair(1, curses.COLOR_WHITE, curses.COLOR_BLUE)  # Закрита картка
+            curses.init_pair(2, curses.COLOR_BLACK, curses.COLOR_YELLOW)  # Відкрита картка
+            curses.init_pair(3, curses.COLOR_WHITE, curses.COLOR_GREEN)  # Знайдена пара
+            self.colors = (curses.color_pair(1), curses.color_pair(2), curses.color_pair(3))
+
+    def setup_board(self, rows: int, cols: int, button_command: Callable[[int], None]) -> None:
+        """Готує порожнє поле rows x cols (усі картки закриті)."""
+        self.rows = rows
+        self.cols = cols
+        self.button_command = button_command
+        self.states = bytearray(rows * cols)
+        self.labels.clear()
+        self.dirty.clear()
+        self.cursor = 0
+        self.top = 0
+        self.left = 0
+        self.message = HELP  # Повідомлення про перемогу попередньої гри більше не актуальне
+        # Найширша позначка: emoji займає дві колонки, далі - номер кола
+        pairs = rows * cols // 2
+        if self.ascii_symbols:
+            widest = len(ascii_label(max(pairs - 1, 0)))
+        else:
+            laps = (pairs - 1) // len(EMOJI_SYMBOLS)
+            widest = 2 + (len(str(laps)) if laps else 0)
+        self.cell_width = max(widest, 1) + 2
+        self.full_redraw = True
+
+    def prepare_symbols(self, symbol_ids) -> None:
+        """Сумісність з MemoryGameGUI: термінал нічого не малює наперед."""
+
+    def update_button(self, idx: int, symbol: str, disabled: bool = False, symbol_id: Optional[int] = None) -> None:
+        """Відкриває картку (або позначає її знайденою)."""
+        self.states[idx] = MATCHED if disabled else REVEALED
+        if self.ascii_symbols and symbol_id is not None:
+            symbol = ascii_label(symbol_id)
+        self.labels[idx] = symbol
+        self.dirty.add(idx)
+
+    def reset_button(self, idx: int) -> None:
+        """Закриває картку."""
+        self.states[idx] = HIDDEN
+        self.labels.pop(idx, None)
+        self.dirty.add(idx)
+
+    def update_moves(self, moves: int) -> None:
+        """Оновлює лічильник ходів."""
+        self.status = f"Moves: {moves}"
+
+    def show_win_message(self, moves: int, par: Optional[float] = None,
+                         scores: Optional[List[int]] = None) -> None:
+        """Показує повідомлення про завершення гри в нижньому рядку (як MemoryGameGUI)."""
+        if scores is None:
+            text = f"You won in {moves} moves!"
+        else:
+            result = "You won" if scores[0] > scores[1] else "CPU won" if scores[0] < scores[1] else "Draw"
+            text = f"{result}! You {scores[0]} : {scores[1]} CPU."
+        if par is not None:
+            text += f" Par: {par:.1f} ({moves - par:+.1f} vs par)."
+        self.message = text + " n - play again, m - menu, q - quit"
+
+    def move_cursor(self, drow: int, dcol: int) -> None:
+        """Переміщує курсор; прокручує поле, якщо курсор виходить за видиму область."""
+        row, col = divmod(self.cursor, self.cols)
+        row = min(max(row + drow, 0), self.rows - 1)
+        col = min(max(col + dcol, 0), self.cols - 1)
+        self.dirty.add(self.cursor)
+        self.cursor = row * self.cols + col
+        self.dirty.add(self.cursor)
+        visible_rows, visible_cols = self._viewport()
+        top = min(max(self.top, row - visible_rows + 1), row)
+        left = min(max(self.left, col - visible_cols + 1), col)
+        if (top, left) != (self.top, self.left):
+            self.top, self.left = top, left
+            self.full_redraw = True
+
+    def click(self) -> None:
+        """Клік на картку під курсором."""
+        if self.button_command:
+            self.button_command(self.cursor)
+
+    def _viewport(self) -> Tuple[int, int]:
+        """Скільки рядків і стовпців поля вміщує термінал."""
+        height, width = self.screen.getmaxyx()
+        return max(1, height - BOARD_TOP - 2), max(1, width // self.cell_width)
+
+    def _draw_cell(self, idx: int, visible_rows: int, visible_cols: int) -> None:
+        row, col = divmod(idx, self.cols)
+        y, x = row - self.top, col - self.left
+        if not (0 <= y < visible_rows and 0 <= x < visible_cols):
+            return
+        state = self.states[idx]
+        text = "?" if state == HIDDEN else self.labels.get(idx, "")
+        attr = self.colors[state]
+        if idx == self.cursor:
+            attr |= curses.A_REVERSE
+        width = self.cell_width - 1
+        # Emoji займає дві колонки: вирівнюємо за шириною на екрані, а не за кількістю символів
+        shown = len(text) + sum(1 for char in text if ord(char) > 0xFFFF)
+        padding = max(0, width - shown)
+        try:
+            self.screen.addstr(BOARD_TOP + y, x * self.cell_width,
+                               " " * (padding // 2) + text + " " * (padding - padding // 2), attr)
+        except curses.error:
+            pass  # Запис у правий нижній кут екрана curses вважає помилкою
+        self.cells_drawn += 1
+
+    def render(self) -> None:
+        """Перемальовує змінені частини екрана одним doupdate."""
+        visible_rows, visible_cols = self._viewport()
+        screen = self.screen
+        if self.full_redraw:
+            screen.erase()
+            self.dirty.clear()
+            last_row = min(self.rows, self.top + visible_rows)
+            last_col = min(self.cols, self.left + visible_cols)
+            for row in range(self.top, last_row):
+                for col in range(self.left, last_col):
+                    self._draw_cell(row * self.cols + col, visible_rows, visible_cols)
+            self.full_redraw = False
+        else:
+            for idx in self.dirty:
+                self._draw_cell(idx, visible_rows, visible_cols)
+            self.dirty.clear()
+        height, width = screen.getmaxyx()
+        for y, text in ((0, self.status), (height - 1, self.message)):
+            try:
+                screen.addstr(y, 0, text[:width - 1].ljust(width - 1))
+            except curses.error:
+                pass
+        screen.noutrefresh()
+        curses.doupdate()
+
+
+class TerminalController:
+    def __init__(self, view: CursesView, reset_delay_ms: int = 500):
+        """Контролер термінальної гри: та сама логіка ходу, що в MemoryGameController, без звуку.
+
+        Args:
+            view: Термінальне подання поля
+            reset_delay_ms: Скільки показувати невдалу пару, якщо гравець не натисне клавішу раніше
+        """
+        self.logic = MemoryGameLogic()
+        self.view = view
+        self.reset_delay_ms = reset_delay_ms
+        self.turns = TurnFlow(self.logic, view)  # Спільний з MemoryGameController перебіг ходу
+        self.reset_deadline = 0.0  # Коли закрити turns.pending_reset (time.monotonic)
+        self.in_menu = True
+
+    def start_game(self, rows: int, cols: int) -> None:
+        """Почати нову гру з заданими розмірами сітки."""
+        self.logic.setup_game(rows, cols)
+        self.in_menu = False
+        self.view.setup_board(rows, cols, self.handle_click)
+        self.turns.begin()
+
+    def handle_click(self, idx: int) -> None:
+        """Обробник кліку на картку: невдала пара попереднього ходу закривається першою."""
+        self.turns.reset_pending()
+        is_match, _, _ = self.turns.flip(idx)
+        if is_match and self.logic.check_win():
+            self.turns.announce_win()
+        elif self.turns.pending_reset:
+            self.reset_deadline = time.monotonic() + self.reset_delay_ms / 1000
+
+    def check_and_reset_pending(self) -> None:
+        """Закриває невдалу пару, якщо вона ще відкрита."""
+        self.turns.reset_pending()
+
+    def show_menu(self) -> None:
+        """Екран вибору рівня."""
+        self.check_and_reset_pending()  # Інакше таймаут getch для невдалої пари крутив би цикл меню
+        self.in_menu = True
+        screen = self.view.screen
+        screen.erase()
+        screen.addstr(0, 0, "Memory Game", curses.A_BOLD)
+        for number, (level, (rows, cols)) in enumerate(self.logic.difficulty_levels.items(), 1):
+            screen.addstr(1 + number, 2, f"{number}. {level} ({rows}x{cols}) · par {par_for_grid(rows, cols):.1f}")
+        screen.addstr(len(self.logic.difficulty_levels) + 3, 2, "q. Exit")
+        screen.noutrefresh()
+        curses.doupdate()
+
+    def run(self, probe: Optional[Callable[[], None]] = None) -> None:
+        """Цикл обробки клавіш до виходу.
+
+        Args:
+            probe: Викликається після першого кадру й завершує цикл (вимірювання старту)
+        """
+        screen = self.view.screen
+        screen.keypad(True)
+        levels = list(self.logic.difficulty_levels.values())
+        if self.in_menu:
+            self.show_menu()
+        else:
+            self.view.render()
+        if probe:
+            probe()
+            return
+        while True:
+            if self.turns.pending_reset and not self.in_menu:
+                # Невдала пара закривається за таймером, якщо раніше не натиснуто клавішу
+                screen.timeout(max(0, int((self.reset_deadline - time.monotonic()) * 1000)))
+            else:
+                screen.timeout(-1)
+            key = screen.getch()
+            if key in (ord("q"), 27):
+                return
+            if self.in_menu:
+                if ord("1") <= key < ord("1") + len(levels):
+                    self.start_game(*levels[key - ord("1")])
+                    self.view.render()
+                continue
+            if key == -1:
+                self.check_and_reset_pending()
+            elif key in _MOVES:
+                self.view.move_cursor(*_MOVES[key])
+            elif key in (ord(" "), ord("\n"), curses.KEY_ENTER):
+                self.view.click()
+            elif key == ord("n"):
+                self.start_game(self.logic.rows, self.logic.cols)
+            elif key == ord("m"):
+                self.show_menu()
+                continue
+            elif key == curses.KEY_RESIZE:
+                self.view.full_redraw = True
+            self.view.render()
+
+
+def main(screen: "curses.window", grid: Optional[Tuple[int, int]], ascii_symbols: bool,
+         startup_probe: bool) -> Optional[float]:
+    """Запускає гру в терміналі; повертає момент першого кадру в режимі startup_probe."""
+    controller = TerminalController(CursesView(screen, ascii_symbols))
+    if grid:
+        controller.start_game(*grid)
+    first_frame: Dict[str, float] = {}
+    controller.run(probe=(lambda: first_frame.setdefault("t", time.perf_counter())) if startup_probe else None)
+    return first_frame.get("t")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Memory Game у терміналі (curses)")
+    parser.add_argument("--grid", help="Одразу почати гру на полі РЯДКИxСТОВПЦІ, напр. 100x100")
+    parser.add_argument("--ascii", action="store_true", help="Символи латиницею замість emoji")
+    parser.add_argument("--startup-probe", action="store_true",
+                        help="Вивести час до першого кадру й вийти (для бенчмарку старту)")
+    args = parser.parse_args()
+
+    locale.setlocale(locale.LC_ALL, "")  # Щоб curses виводив emoji як UTF-8
+    grid_size = tuple(int(value) for value in args.grid.lower().split("x")) if args.grid else None
+    first_frame_at = curses.wrapper(main, grid_size, args.ascii, args.startup_probe)
+    if first_frame_at is not None:
+        print(f"STARTUP import_ms={(_IMPORTS_DONE - _START_TIME) * 1000:.2f} "
+              f"first_frame_ms={(first_frame_at - _START_TIME) * 1000:.2f}", flush=True)
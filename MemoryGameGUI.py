@@ -1,6 +1,11 @@
+import time
 import tkinter as tk
-from tkinter import font, messagebox
-from typing import List, Optional, Dict, Tuple, Callable
+from typing import List, Optional, Dict, Tuple, Callable, Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Модуль полотна імпортується лише тоді, коли справді потрібне велике поле
+    from MemoryGameCanvas import CanvasBoard
+    from MemoryGameSymbols import SymbolProvider
 
 class MemoryGameGUI:
     def __init__(self, root: tk.Tk, difficulty_levels: Dict[str, Tuple[int, int]]):
@@ -22,22 +27,70 @@ class MemoryGameGUI:
         self.highlight_color = "#ffd166"  # колір підсвічування
         self.text_color = "#2b2d42"  # основний колір тексту
         self.button_hover = "#2a628f"  # колір кнопок при наведенні
+        self.hint_color = "#ff9f1c"  # колір картки, яку радить підказка
 
         self.buttons: List[tk.Button] = []  # список кнопок-карток
+        self.canvas_board: Optional["CanvasBoard"] = None  # поле на полотні для великих сіток
+        self.renderer: str = "auto"  # "buttons", "canvas" або "auto" (за розміром поля)
+        self.canvas_threshold: int = 400  # з якої кількості карток "auto" обирає полотно
         self.moves_label: Optional[tk.Label] = None  # мітка для відображення ходів
         self.difficulty_command: Optional[Callable] = None  # функція обробки вибору складності
+        self.level_par: Dict[str, float] = {}  # par (очікувані ходи при оптимальній грі) для рівнів
+        self.level_buttons: Dict[str, tk.Button] = {}  # кнопки рівнів у меню (для дописування par)
+        self.button_command: Optional[Callable] = None  # обробник кліку на картку поточної гри
+        self.hint_command: Optional[Callable] = None  # обробник кнопки підказки (None - кнопки немає)
+        self.menu_command: Optional[Callable] = None  # вихід у меню через контролер (None - лише показати меню)
+        self.players_label: Optional[tk.Label] = None  # рахунок гри проти комп'ютера
+
+        # Пул віджетів: екрани та кнопки-картки створюються один раз і перевикористовуються
+        self.pool_widgets: bool = True  # False - старий режим зі знищенням усіх віджетів
+        self.menu_frame: Optional[tk.Frame] = None  # фрейм меню
+        self.header_frame: Optional[tk.Frame] = None  # верхня панель ігрового екрана
+        self.board_frame: Optional[tk.Frame] = None  # фрейм ігрового поля
+        self.board_cols: int = 0  # кількість стовпців, за якою розкладено кнопки пулу
+        self.shown_cards: int = 0  # кількість кнопок пулу, показаних на полі
+        self.last_setup_ms: float = 0.0  # тривалість останнього setup_board, мс
+
+        # Черга оновлень: зміни карток і мітки за одну подію зливаються та застосовуються
+        # одним викликом config на віджет в after_idle
+        self.batch_updates: bool = True  # False - кожна зміна одразу окремим config
+        self.pending_updates: Dict[tk.Widget, Dict[str, object]] = {}  # віджет -> злиті опції
+        self.applied_options: Dict[tk.Widget, Dict[str, object]] = {}  # останні застосовані опції
+        self.flush_scheduled: bool = False
+        self.config_calls: int = 0  # лічильник викликів config (Tcl) для вимірювань
+
+        # Символи-зображення: плитки малюються один раз і беруться з LRU-кешу замість тексту з емодзі
+        self.use_tiles: bool = False  # задається до першого setup_board
+        self.tile_size: int = 44  # розмір плитки в пікселях
+        self.tile_theme: str = "default"  # палітра з MemoryGameSymbols.THEMES
+        self.tile_cache_dir: Optional[str] = None  # каталог PNG-кешу плиток (None - лише пам'ять)
+        self.symbol_provider: Optional["SymbolProvider"] = None
 
     def setup_menu(self, difficulty_command: Callable) -> None:
         """Створення головного меню з вибором рівня складності.
         Args:
             difficulty_command: Функція, яка буде викликатись при виборі рівня
         """
-        self.clear_window()
         self.difficulty_command = difficulty_command
+        self._hide_screens()
+        if self.menu_frame is None:
+            self._build_menu()
+        self.menu_frame.pack(expand=True, padx=20, pady=20)
 
+    def _hide_screens(self) -> None:
+        """Ховає поточний екран: у режимі пулу - лише від'єднує фрейми, інакше знищує віджети."""
+        if not self.pool_widgets:
+            self.clear_window()
+            return
+        for frame in (self.menu_frame, self.header_frame, self.board_frame):
+            if frame is not None:
+                frame.pack_forget()
+
+    def _build_menu(self) -> None:
+        """Створює фрейм меню (один раз у режимі пулу)."""
         # Фрейм для меню
         menu_frame = tk.Frame(self.root, bg=self.bg_color)
-        menu_frame.pack(expand=True, padx=20, pady=20)
+        self.menu_frame = menu_frame
 
         # Заголовок гри
         title = tk.Label(
@@ -50,13 +103,14 @@ class MemoryGameGUI:
         title.pack(pady=(0, 30))
 
         # Кнопки рівнів складності
+        self.level_buttons = {}
         for level, (rows, cols) in self.difficulty_levels.items():
             btn = tk.Button(
                 menu_frame,
-                text=f"{level} ({rows}×{cols})",  # Назва рівня та розмірність
+                text=self._level_text(level),
                 font=self.card_font,
                 command=lambda r=rows, c=cols: self.difficulty_command(r, c),
-                width=18,
+                width=24,
                 pady=8,
                 bg=self.card_bg,
                 fg="white",
@@ -65,6 +119,7 @@ class MemoryGameGUI:
                 bd=0
             )
             btn.pack(pady=6)
+            self.level_buttons[level] = btn
             # Ефекти при наведенні курсора
             btn.bind("<Enter>", lambda e, b=btn: b.config(bg=self.button_hover))
             btn.bind("<Leave>", lambda e, b=btn: b.config(bg=self.card_bg))
@@ -75,7 +130,7 @@ class MemoryGameGUI:
             text="Exit",
             font=self.card_font,
             command=self.root.quit,
-            width=18,
+            width=24,
             pady=8,
             bg="#d64045",  # червоний колір для кнопки виходу
             fg="white",
@@ -86,6 +141,24 @@ class MemoryGameGUI:
         exit_btn.bind("<Enter>", lambda e: exit_btn.config(bg="#c73232"))
         exit_btn.bind("<Leave>", lambda e: exit_btn.config(bg="#d64045"))
 
+    def _level_text(self, level: str) -> str:
+        """Підпис кнопки рівня: назва, розмірність і par, якщо він уже відомий."""
+        rows, cols = self.difficulty_levels[level]
+        text = f"{level} ({rows}×{cols})"
+        if level in self.level_par:
+            text += f" · par {self.level_par[level]:.1f}"
+        return text
+
+    def set_level_par(self, level_par: Dict[str, float]) -> None:
+        """Дописує par до кнопок рівнів (par рахується вже після першого кадру меню).
+        Args:
+            level_par: par для кожного рівня складності
+        """
+        self.level_par = level_par
+        if self.menu_frame is not None:
+            for level, btn in self.level_buttons.items():
+                self.queue_config(btn, text=self._level_text(level))
+
     def setup_board(self, rows: int, cols: int, button_command: Callable) -> None:
         """Налаштування ігрового поля з картками.
         Args:
@@ -93,11 +166,58 @@ class MemoryGameGUI:
             cols: Кількість стовпців
             button_command: Функція-обробник кліку на картку
         """
-        self.clear_window()
+        start = time.perf_counter()
+        self._hide_screens()
+        self.button_command = button_command
+        if self.use_tiles and self.symbol_provider is None:
+            from MemoryGameSymbols import SymbolProvider
+            self.symbol_provider = SymbolProvider(self.root, self.tile_size, self.tile_theme,
+                                                  disk_cache_dir=self.tile_cache_dir)
+        if self.header_frame is None:
+            self._build_header()
+        self.header_frame.pack(fill="x", pady=(10, 20), padx=20)
+        self.queue_config(self.moves_label, text="Moves: 0")
+
+        # Ігрове поле
+        if self.board_frame is None:
+            self.board_frame = tk.Frame(self.root, bg=self.bg_color)
+        self.board_frame.pack(expand=True, padx=20, pady=(0, 20))
+
+        if self.renderer == "canvas" or (self.renderer == "auto" and rows * cols >= self.canvas_threshold):
+            # Велике поле - одне полотно з віртуалізацією замість кнопок
+            self._layout_buttons(0, cols)
+            if self.canvas_board and (self.canvas_board.rows, self.canvas_board.cols) == (rows, cols):
+                self.canvas_board.reset(button_command)
+            else:
+                if self.canvas_board:
+                    self.canvas_board.frame.destroy()
+                from MemoryGameCanvas import CanvasBoard
+                self.canvas_board = CanvasBoard(self.board_frame, rows, cols, button_command, self)
+                self.canvas_board.grid(row=0, column=0, sticky="nsew")
+        else:
+            if self.canvas_board:
+                self.canvas_board.frame.destroy()
+                self.canvas_board = None
+            self._layout_buttons(rows * cols, cols)
+        self.last_setup_ms = (time.perf_counter() - start) * 1000
+
+    def prepare_symbols(self, symbol_ids: Iterable[int]) -> None:
+        """Домальовує плитки символів поточного поля у фоні (idle), щоб перше відкриття не чекало."""
+        if self.symbol_provider:
+            self.symbol_provider.warm(symbol_ids)
 
+    def _open_menu(self) -> None:
+        """Повертає з гри в меню; контролер через menu_command спершу зупиняє таймери ходу."""
+        if self.menu_command:
+            self.menu_command()
+        else:
+            self.setup_menu(self.difficulty_command)
+
+    def _build_header(self) -> None:
+        """Створює верхню панель ігрового екрана (один раз у режимі пулу)."""
         # Верхня панель з лічильником ходів та кнопкою меню
         header_frame = tk.Frame(self.root, bg=self.bg_color)
-        header_frame.pack(fill="x", pady=(10, 20), padx=20)
+        self.header_frame = header_frame
         self.moves_label = tk.Label(
             header_frame,
             text="Moves: 0",
@@ -106,12 +226,13 @@ class MemoryGameGUI:
             fg=self.text_color
         )
         self.moves_label.pack(side="left")
+        self.applied_options[self.moves_label] = {"text": "Moves: 0"}
         # Кнопка повернення до головного меню
         menu_btn = tk.Button(
             header_frame,
             text="Menu",
             font=("Arial", 12),
-            command=lambda: self.setup_menu(self.difficulty_command),
+            command=self._open_menu,
             padx=15,
             pady=3,
             bg="#8d99ae",
@@ -122,43 +243,103 @@ class MemoryGameGUI:
         menu_btn.pack(side="right")
         menu_btn.bind("<Enter>", lambda e: menu_btn.config(bg="#6c757d"))
         menu_btn.bind("<Leave>", lambda e: menu_btn.config(bg="#8d99ae"))
+        if self.hint_command:
+            # Кнопка підказки: підсвічує картку, яку варто відкрити наступною
+            hint_btn = tk.Button(
+                header_frame,
+                text="Hint",
+                font=("Arial", 12),
+                command=lambda: self.hint_command(),
+                padx=15,
+                pady=3,
+                bg=self.hint_color,
+                fg="white",
+                activebackground="#e08e0b",
+                relief="flat"
+            )
+            hint_btn.pack(side="right", padx=(0, 10))
+            hint_btn.bind("<Enter>", lambda e: hint_btn.config(bg="#e08e0b"))
+            hint_btn.bind("<Leave>", lambda e: hint_btn.config(bg=self.hint_color))
 
-        # Ігрове поле
-        board_frame = tk.Frame(self.root, bg=self.bg_color)
-        board_frame.pack(expand=True, padx=20, pady=(0, 20))
-
-        self.buttons = []  # Очищення списку кнопок
-        for i in range(rows):
-            for j in range(cols):
-                idx = i * cols + j  # Лінійний індекс кнопки
-                btn = tk.Button(
-                    board_frame,
-                    text="?",  # Початковий стан - знак питання
-                    font=self.card_font,
-                    width=4,
-                    height=2,
-                    bg=self.card_bg,
-                    fg=self.card_fg,
-                    activebackground=self.button_hover,
-                    command=lambda x=idx: button_command(x),
-                    relief="raised",
-                    borderwidth=3
-                )
-                btn.grid(row=i, column=j, padx=5, pady=5, ipadx=5, ipady=5)
-                self.buttons.append(btn)
-
-    def update_button(self, idx: int, symbol: str, disabled: bool = False) -> None:
+    def _layout_buttons(self, cards: int, cols: int) -> None:
+        """Показує перші `cards` кнопок пулу в сітці з `cols` стовпцями.
+
+        Наявні кнопки скидаються на місці, бракуючі дозбираються, зайві ховаються.
+        Args:
+            cards: Кількість карток на полі
+            cols: Кількість стовпців
+        """
+        while len(self.buttons) < cards:
+            idx = len(self.buttons)  # Лінійний індекс кнопки
+            face = self._hidden_face()
+            if self.symbol_provider:
+                # З зображенням ширина й висота задаються в пікселях, тож розмір картки не стрибає
+                size = {"width": self.tile_size, "height": self.tile_size, "compound": "center"}
+            else:
+                size = {"width": 4, "height": 2}
+            btn = tk.Button(
+                self.board_frame,
+                font=self.card_font,
+                bg=self.card_bg,
+                fg=self.card_fg,
+                activebackground=self.button_hover,
+                command=lambda x=idx: self.button_command(x),
+                relief="raised",
+                borderwidth=3,
+                **face,  # Початковий стан - знак питання
+                **size
+            )
+            self.applied_options[btn] = {**face, "bg": self.card_bg, "fg": self.card_fg,
+                                         "state": "normal", "relief": "raised"}
+            self.buttons.append(btn)
+
+        relayout = cols != self.board_cols
+        # Скидаються всі кнопки попередньої гри, і ті, що ховаються: коли їх покажуть знову
+        # (менше поле, полотно, потім більше поле), на них не лишиться стан старої гри
+        for idx in range(self.shown_cards):
+            self._hide_card(self.buttons[idx])
+        for idx in range(cards):
+            if relayout or idx >= self.shown_cards:
+                i, j = divmod(idx, cols)
+                self.buttons[idx].grid(row=i, column=j, padx=5, pady=5, ipadx=5, ipady=5)
+        for idx in range(cards, self.shown_cards):
+            self.buttons[idx].grid_remove()
+        self.board_cols = cols
+        self.shown_cards = cards
+
+    def _hidden_face(self) -> Dict[str, object]:
+        """Опції зображення закритої картки."""
+        if self.symbol_provider:
+            return {"image": self.symbol_provider.back(), "text": ""}
+        return {"text": "?"}
+
+    def _symbol_face(self, symbol: str, symbol_id: Optional[int]) -> Dict[str, object]:
+        """Опції зображення відкритої картки: плитка з кешу або текст символу."""
+        if self.symbol_provider:
+            if symbol_id is None:
+                return {"image": self.symbol_provider.blank(), "text": ""}
+            return {"image": self.symbol_provider.get(symbol_id), "text": ""}
+        return {"text": symbol}
+
+    def update_button(self, idx: int, symbol: str, disabled: bool = False, symbol_id: Optional[int] = None) -> None:
         """Оновлення вигляду картки.
         Args:
             idx: Індекс кнопки
             symbol: Символ, який відображатиметься
             disabled: Чи картка знайдена (неактивна)
+            symbol_id: Ідентифікатор символу для плитки-зображення (None - порожня картка)
         """
+        if self.canvas_board:
+            self.canvas_board.reveal_cell(idx, symbol, disabled, symbol_id)
+            return
         btn = self.buttons[idx]
+        # Застосовані опції тримають посилання на зображення, тож витіснене з кешу не зникне з картки
+        face = self._symbol_face(symbol, symbol_id)
         if disabled:
             # Стан знайденої пари
-            btn.config(
-                text=symbol,
+            self.queue_config(
+                btn,
+                **face,
                 state="disabled",
                 disabledforeground="white",
                 bg=self.disabled_color,
@@ -166,47 +347,157 @@ class MemoryGameGUI:
             )
         else:
             # Стан відкритої картки
-            btn.config(
-                text=symbol,
+            self.queue_config(
+                btn,
+                **face,
                 bg=self.highlight_color,
                 fg="black",
                 relief="sunken"
             )
 
+    def restore_matched(self, matched: bytes, label_of: Callable[[int], Tuple[str, Optional[int]]]) -> None:
+        """Показує знайдені картки відновленої гри.
+        Args:
+            matched: Бітова множина знайдених карток
+            label_of: Функція індекс -> (текст символу, ідентифікатор символу або None для порожньої)
+        """
+        if self.canvas_board:
+            self.canvas_board.restore_matched(matched, label_of)
+            return
+        for byte_index, bits in enumerate(matched):
+            while bits:
+                low = bits & -bits
+                idx = byte_index * 8 + low.bit_length() - 1
+                text, symbol_id = label_of(idx)
+                self.update_button(idx, text, True, symbol_id)
+                bits ^= low
+
     def reset_button(self, idx: int) -> None:
         """Повернення картки у початковий стан.
         Args:
             idx: Індекс кнопки
         """
-        btn = self.buttons[idx]
-        btn.config(
-            text="?",
+        if self.canvas_board:
+            self.canvas_board.hide_cell(idx)
+            return
+        self._hide_card(self.buttons[idx])
+
+    def _hide_card(self, btn: tk.Button) -> None:
+        """Закрита картка: зворот, активна (кнопка пулу, незалежно від поточного поля)."""
+        self.queue_config(
+            btn,
+            **self._hidden_face(),
             bg=self.card_bg,
             fg=self.card_fg,
             state="normal",
             relief="raised"
         )
 
+    def show_hint(self, idx: int) -> None:
+        """Підсвічує закриту картку, яку радить підказка (знімається через reset_button).
+        Args:
+            idx: Індекс картки
+        """
+        if self.canvas_board:
+            self.canvas_board.hint_cell(idx)
+            return
+        self.queue_config(self.buttons[idx], bg=self.hint_color)
+
+    def update_players(self, text: str) -> None:
+        """Оновлення рядка з рахунком гравців (порожній текст ховає його).
+        Args:
+            text: Рахунок і чий хід
+        """
+        if self.players_label is None:
+            if not text:
+                return
+            self.players_label = tk.Label(
+                self.header_frame,
+                font=("Arial", 12),
+                bg=self.bg_color,
+                fg=self.text_color
+            )
+        if text:
+            self.players_label.pack(side="left", padx=(15, 0))
+            self.queue_config(self.players_label, text=text)
+        else:
+            self.players_label.pack_forget()
+
     def update_moves(self, moves: int) -> None:
         """Оновлення лічильника ходів.
         Args:
             moves: Поточна кількість ходів
         """
-        self.moves_label.config(text=f"Moves: {moves}")
+        self.queue_config(self.moves_label, text=f"Moves: {moves}")
+
+    def queue_config(self, widget: tk.Widget, **options) -> None:
+        """Ставить зміну опцій віджета в чергу оновлень.
+
+        Зміни одного віджета за подію зливаються (пізніші перекривають ранні), а при
+        застосуванні відкидаються опції, що вже мають таке значення, - тож зміни,
+        які скасовують одна одну (відкрили й одразу закрили картку), не дають жодного виклику Tcl.
+        Args:
+            widget: Віджет (кнопка-картка або мітка)
+            **options: Опції для config
+        """
+        if not self.batch_updates:
+            self._apply_config(widget, options)
+            return
+        self.pending_updates.setdefault(widget, {}).update(options)
+        if not self.flush_scheduled:
+            self.flush_scheduled = True
+            self.root.after_idle(self.flush_updates)
+
+    def flush_updates(self) -> None:
+        """Застосовує всі злиті зміни з черги."""
+        self.flush_scheduled = False
+        pending, self.pending_updates = self.pending_updates, {}
+        for widget, options in pending.items():
+            self._apply_config(widget, options)
+
+    def _apply_config(self, widget: tk.Widget, options: Dict[str, object]) -> None:
+        """Викликає config лише для опцій, що відрізняються від уже застосованих."""
+        applied = self.applied_options.setdefault(widget, {})
+        changed = {key: value for key, value in options.items() if applied.get(key) != value}
+        if changed:
+            widget.config(**changed)
+            applied.update(changed)
+            self.config_calls += 1
 
     def clear_window(self) -> None:
-        """Очищення вікна від віджетів."""
+        """Очищення вікна від віджетів (разом із пулом)."""
         for widget in self.root.winfo_children():
             widget.destroy()
+        self.menu_frame = None
+        self.level_buttons = {}
+        self.header_frame = None
+        self.board_frame = None
+        self.moves_label = None
+        self.players_label = None
+        self.buttons = []
+        self.canvas_board = None
+        self.board_cols = 0
+        self.shown_cards = 0
+        self.pending_updates.clear()
+        self.applied_options.clear()
 
-    def show_win_message(self, moves: int) -> None:
-        """Відображення повідомлення про перемогу.
+    def show_win_message(self, moves: int, par: Optional[float] = None,
+                         scores: Optional[List[int]] = None) -> None:
+        """Відображення повідомлення про завершення гри.
         Args:
             moves: Кількість ходів, за які завершено гру
+            par: Очікувана кількість ходів при оптимальній грі (якщо відома)
+            scores: Рахунок гри вдвох [гравець, комп'ютер] (None - одиночна гра)
         """
+        if scores is None:
+            title, summary = "You Won! 🎉", f"Completed in {moves} moves!"
+        else:
+            title = ("You Won! 🎉" if scores[0] > scores[1] else
+                     "Computer Won!" if scores[0] < scores[1] else "It's a Draw!")
+            summary = f"Score: You {scores[0]} : {scores[1]} CPU"
         win_window = tk.Toplevel(self.root)
         win_window.title("Congratulations!")
-        win_window.geometry("400x250")
+        win_window.geometry("400x280" if par is not None else "400x250")
         win_window.resizable(False, False)
         win_window.configure(bg=self.bg_color)
         win_window.grab_set()  # Модальне вікно
@@ -221,7 +512,7 @@ class MemoryGameGUI:
         # Повідомлення про перемогу
         tk.Label(
             win_window,
-            text="You Won! 🎉",
+            text=title,
             font=("Arial", 22, "bold"),
             bg=self.bg_color,
             fg=self.disabled_color
@@ -229,12 +520,22 @@ class MemoryGameGUI:
 
         tk.Label(
             win_window,
-            text=f"Completed in {moves} moves!",
+            text=summary,
             font=("Arial", 14),
             bg=self.bg_color,
             fg=self.text_color
         ).pack(pady=10)
 
+        if par is not None:
+            # Порівняння з оптимальною грою
+            tk.Label(
+                win_window,
+                text=f"Par: {par:.1f} ({moves - par:+.1f} vs par)",
+                font=("Arial", 12),
+                bg=self.bg_color,
+                fg=self.text_color
+            ).pack()
+
         # Фрейм для кнопок
         button_frame = tk.Frame(win_window, bg=self.bg_color)
         button_frame.pack(pady=20)
@@ -244,7 +545,7 @@ class MemoryGameGUI:
             button_frame,
             text="Play Again",
             font=("Arial", 12, "bold"),
-            command=lambda: [win_window.destroy(), self.setup_menu(self.difficulty_command)],
+            command=lambda: [win_window.destroy(), self._open_menu()],
             bg=self.card_bg,
             fg="white",
             padx=20,
@@ -0,0 +1,264 @@
+import random
+from array import array
+from itertools import compress
+from typing import Dict, Iterable, Optional, Tuple
+
+from MemoryGameLogic import MemoryGameLogic, EMOJI_SYMBOLS
+
+# Байт бітової множини знайдених карток -> 8 байтів-прапорців "картка ще не знайдена"
+_UNMATCHED_FLAGS = [bytes(not bits >> bit & 1 for bit in range(8)) for bits in range(256)]
+
+
+class SparseSet:
+    """Множина цілих з [0, universe) на масивах: O(1) додавання, видалення, перевірка й вибір.
+
+    На відміну від множини на словнику, повна множина створюється одним
+    array(range(n)) без інтерпретатора на кожен елемент.
+    """
+
+    __slots__ = ("items", "positions", "size")
+
+    def __init__(self, universe: int, full: bool = False):
+        self.items = array("I", range(universe)) if full else array("I", bytes(4 * universe))
+        self.positions = array("I", self.items) if full else array("I", bytes(4 * universe))
+        self.size = universe if full else 0
+
+    @classmethod
+    def from_members(cls, universe: int, members: Iterable[int]) -> "SparseSet":
+        """Множина з різних наперед відомих елементів (без перевірки членства на кожен)."""
+        result = cls(universe)
+        items = array("I", members)
+        result.size = len(items)
+        result.items[:result.size] = items
+        positions = result.positions
+        for pos, value in enumerate(items):
+            positions[value] = pos
+        return result
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, value: int) -> bool:
+        pos = self.positions[value]
+        return pos < self.size and self.items[pos] == value
+
+    def add(self, value: int) -> None:
+        if value not in self:
+            self.items[self.size] = value
+            self.positions[value] = self.size
+            self.size += 1
+
+    def discard(self, value: int) -> None:
+        if value not in self:
+            return
+        pos = self.positions[value]
+        self.size -= 1
+        last = self.items[self.size]
+        self.items[pos] = last
+        self.positions[last] = pos
+
+    def last(self) -> Optional[int]:
+        """Останній доданий (або переміщений у кінець) елемент."""
+        return self.items[self.size - 1] if self.size else None
+
+    def choice(self, rng: random.Random) -> Optional[int]:
+        """Випадковий елемент або None, якщо множина порожня."""
+        return self.items[rng.randrange(self.size)] if self.size else None
+
+
+class KnowledgeTracker:
+    # Фіксований набір атрибутів: без __dict__, як у MemoryGameLogic
+    __slots__ = ("rng", "unknown", "card_symbol", "seen", "pair_cards", "pairs", "_pending")
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        """Ідеальна пам'ять про відкриті картки, що оновлюється за O(1) на кожне відкриття.
+
+        Зберігає індекс символ -> бачені незнайдені позиції, множину ще не бачених
+        карток і множину символів, обидві картки яких відомі. Найкращий хід
+        (стратегія ідеальної пам'яті) визначається без обходу поля.
+        Args:
+            rng: Генератор для вибору невідомої картки (None - новий випадковий)
+        """
+        self.rng = rng or random.Random()
+        self.unknown = SparseSet(0)  # Незнайдені картки, яких ще ніхто не відкривав
+        self.card_symbol: Dict[int, int] = {}  # Бачена незнайдена картка -> символ
+        self.seen: Dict[int, int] = {}  # Символ -> єдина бачена картка (друга ще невідома)
+        self.pair_cards: Dict[int, Tuple[int, int]] = {}  # Символ -> обидві відомі незнайдені картки
+        self.pairs = SparseSet(0)  # Символи з pair_cards (для вибору за O(1))
+        # Стан гри з останнього reset, з якого множини ще не побудовано (None - побудовано)
+        self._pending: Optional[Tuple[int, int, bytes, Optional[int], int]] = None
+
+    def reset(self, logic: MemoryGameLogic) -> None:
+        """Починає відстеження нової (або відновленої) гри: невідомі всі незнайдені картки.
+
+        Відкрита перша картка незавершеного ходу вважається побаченою. Самі множини
+        будуються при першому зверненні: на великому полі це десятки мілісекунд,
+        яких старт і відновлення гри не чекають.
+        """
+        first_index = logic.first_index
+        self._pending = (logic.rows * logic.cols, logic.pairs_needed,
+                         bytes(logic.matched) if logic.matched_pairs or logic.blank_index is not None else b"",
+                         first_index, logic.symbol_ids[first_index] if first_index is not None else 0)
+        self.card_symbol.clear()
+        self.seen.clear()
+        self.pair_cards.clear()
+
+    def _build(self) -> None:
+        cards, pairs_needed, matched, first_index, first_symbol = self._pending
+        self._pending = None
+        if matched:
+            # Незнайдені картки відбираються на рівні C, а не видаленням по одній з повної множини
+            flags = b"".join(map(_UNMATCHED_FLAGS.__getitem__, matched))
+            self.unknown = SparseSet.from_members(cards, compress(range(cards), flags))
+        else:
+            self.unknown = SparseSet(cards, full=True)
+        # Малі поля беруть символи з EMOJI_SYMBOLS, великі - ідентифікатори 0..pairs_needed-1
+        self.pairs = SparseSet(max(len(EMOJI_SYMBOLS), pairs_needed))
+        if first_index is not None:
+            self.observe(first_index, first_symbol)
+
+    def observe(self, idx: int, symbol_id: int) -> None:
+        """Запам'ятовує відкриту картку."""
+        if self._pending is not None:
+            self._build()
+        if idx not in self.unknown:
+            return  # Картку вже бачили
+        self.unknown.discard(idx)
+        self.card_symbol[idx] = symbol_id
+        other = self.seen.pop(symbol_id, None)
+        if other is None:
+            self.seen[symbol_id] = idx
+        else:
+            self.pair_cards[symbol_id] = (other, idx)
+            self.pairs.add(symbol_id)
+
+    def matched(self, idx1: int, idx2: int) -> None:
+        """Забуває знайдену пару."""
+        if self._pending is not None:
+            self._build()
+        symbol_id = self.card_symbol.pop(idx1, None)
+        self.card_symbol.pop(idx2, None)
+        self.unknown.discard(idx1)
+        self.unknown.discard(idx2)
+        if symbol_id is not None:
+            self.seen.pop(symbol_id, None)
+            self.pair_cards.pop(symbol_id, None)
+            self.pairs.discard(symbol_id)
+
+    def partner(self, idx: int) -> Optional[int]:
+        """Відома друга картка пари для idx або None."""
+        cards = self.pair_cards.get(self.card_symbol.get(idx, -1))
+        if cards is None:
+            return None
+        return cards[1] if cards[0] == idx else cards[0]
+
+    def best_move(self, first_index: Optional[int] = None) -> Optional[int]:
+        """Картка, яку варто відкрити наступною.
+
+        Args:
+            first_index: Картка, вже відкрита в поточному ході (None - хід починається)
+        Returns:
+            Optional[int]: Індекс картки або None, якщо відкривати нічого
+        """
+        if self._pending is not None:
+            self._build()
+        if first_index is not None:
+            partner = self.partner(first_index)
+            if partner is not None:
+                return partner
+        elif self.pairs:
+            return self.pair_cards[self.pairs.last()][0]
+        idx = self.unknown.choice(self.rng)
+        if idx is None:
+            # Невідомих карток немає: лишилися тільки відомі одиночні (напр., перша картка ходу)
+            idx = next((card for card in self.seen.values() if card != first_index), None)
+        return idx
+
+
+def benchmark(sizes: Tuple[Tuple[int, int], ...] = ((10, 10), (100, 100), (1000, 1000)), clicks: int = 200_000) -> None:
+    """Вимірює додаткову ціну відстеження на клік і час best_move на полях різного розміру.
+
+    Кліки - випадкова гра, як у людини-новачка, тож пам'ять наповнюється відомими
+    картками; best_move викликається перед кожним кліком, як кнопка підказки.
+    """
+    import time
+
+    for rows, cols in sizes:
+        cards = rows * cols
+        timings = {}
+        for tracked in (False, True):
+            logic = MemoryGameLogic()
+            logic.setup_game(rows, cols, seed=1)
+            tracker = KnowledgeTracker(random.Random(0))
+            setup_start = time.perf_counter()
+            if tracked:
+                tracker.reset(logic)
+                tracker._build()  # Разом із відкладеною побудовою множин
+            setup = time.perf_counter() - setup_start
+            rng = random.Random(2)
+            hint_time = 0.0
+            start = time.perf_counter()
+            for _ in range(clicks):
+                if logic.last_mismatch:
+                    logic.reset_turn()
+                idx = rng.randrange(cards)
+                if tracked:
+                    hint = time.perf_counter()
+                    tracker.best_move(logic.first_index)
+                    hint_time += time.perf_counter() - hint
+                is_match, first_index, symbol = logic.handle_click(idx)
+                if tracked and symbol:
+                    tracker.observe(idx, logic.symbol_ids[idx])
+                    if is_match:
+                        tracker.matched(idx, first_index)
+                if is_match:
+                    logic.reset_turn()
+                if logic.check_win():
+                    logic.setup_game(rows, cols, seed=1)
+                    if tracked:
+                        tracker.reset(logic)
+            timings[tracked] = (time.perf_counter() - start, hint_time, setup, len(tracker.card_symbol))
+        base = timings[False][0]
+        total, hints, setup, known = timings[True]
+        print(f"{rows}x{cols}: логіка {base / clicks * 1e6:.2f} мкс/клік, з відстеженням "
+              f"{(total - hints) / clicks * 1e6:.2f} мкс/клік (+{(total - hints - base) / clicks * 1e6:.2f}), "
+              f"best_move {hints / clicks * 1e6:.2f} мкс; reset {setup * 1000:.1f} мс; відомих карток {known}")
+
+
+def par_check(rows: int, cols: int, games: int) -> float:
+    """Середня кількість ходів, якщо завжди слідувати best_move (має збігатися з par)."""
+    logic = MemoryGameLogic()
+    tracker = KnowledgeTracker(random.Random(0))
+    total = 0
+    for game in range(games):
+        logic.setup_game(rows, cols, seed=game)
+        tracker.reset(logic)
+        while not logic.check_win():
+            idx = tracker.best_move(logic.first_index)
+            is_match, first_index, symbol = logic.handle_click(idx)
+            tracker.observe(idx, logic.symbol_ids[idx])
+            if is_match:
+                tracker.matched(idx, first_index)
+            if first_index is not None:
+                logic.reset_turn()
+        total += logic.moves
+    return total / games
+
+
+if __name__ == "__main__":
+    import argparse
+    from MemoryGameSolver import par_for_grid
+    parser = argparse.ArgumentParser(description="Відстеження відомих карток: підказки та комп'ютерний суперник")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    bench_parser = subparsers.add_parser("bench", help="Ціна відстеження на клік")
+    bench_parser.add_argument("--clicks", type=int, default=200_000)
+    check_parser = subparsers.add_parser("check", help="Гра за підказками проти par")
+    check_parser.add_argument("--games", type=int, default=20_000)
+    args = parser.parse_args()
+
+    if args.command == "bench":
+        benchmark(clicks=args.clicks)
+    else:
+        for level, (level_rows, level_cols) in MemoryGameLogic().difficulty_levels.items():
+            print(f"{level}: за best_move {par_check(level_rows, level_cols, args.games):.2f} ходів, "
+                  f"par {par_for_grid(level_rows, level_cols):.2f}")
@@ -1,7 +1,36 @@
 from typing import List, Dict, Tuple, Optional
+from array import array
 import random
 
+# Набір emoji для карток; для великих полів символи нумеруються по колу
+EMOJI_SYMBOLS: List[str] = ["🐶", "🐱", "🐭", "🐹", "🐰", "🦊", "🐻", "🐼",
+                            "🐨", "🐯", "🦁", "🐮", "🐷", "🐸", "🐵", "🐔",
+                            "🐧", "🐦", "🐤", "🦄", "🐝", "🐛", "🦋", "🐌"]
+
+# Ідентифікатор порожньої картки, яка залишається на полі з непарною кількістю клітинок
+BLANK_ID: int = 0xFFFFFFFF
+
+
+def symbol_name(symbol_id: int) -> str:
+    """Повертає текст символу за його ідентифікатором.
+
+    Args:
+        symbol_id (int): Ідентифікатор символу
+    Returns:
+        str: Emoji (з номером кола, якщо emoji не вистачає) або "" для порожньої картки
+    """
+    if symbol_id == BLANK_ID:
+        return ""
+    lap, pos = divmod(symbol_id, len(EMOJI_SYMBOLS))
+    return EMOJI_SYMBOLS[pos] if lap == 0 else f"{EMOJI_SYMBOLS[pos]}{lap}"
+
+
 class MemoryGameLogic:
+    # Фіксований набір атрибутів: без __dict__ на кожен екземпляр
+    __slots__ = ("difficulty_levels", "rows", "cols", "seed", "pairs_needed", "symbol_ids",
+                 "revealed", "matched", "matched_pairs", "blank_index", "moves",
+                 "first_symbol", "first_index", "can_click", "last_mismatch")
+
     def __init__(self):
         # Налаштування гри: рівні складності та відповідні розміри сітки (рядки, стовпці)
         self.difficulty_levels: Dict[str, Tuple[int, int]] = {
@@ -13,51 +42,137 @@ class MemoryGameLogic:
         # Стан гри
         self.rows: int = 0  # Кількість рядків у грі
         self.cols: int = 0  # Кількість стовпців у грі
+        self.seed: int = 0  # Зерно генератора, з якого розкладено поточне поле
         self.pairs_needed: int = 0  # Необхідна кількість пар для поточної гри
-        self.symbols: List[str] = []  # Список символів на картках
+        self.symbol_ids: array = array("I")  # Ідентифікатори символів на картках
+        self.revealed: bytearray = bytearray()  # Бітова множина відкритих карток
+        self.matched: bytearray = bytearray()  # Бітова множина знайдених карток
+        self.matched_pairs: int = 0  # Лічильник знайдених пар
+        self.blank_index: Optional[int] = None  # Порожня картка на непарному полі
         self.moves: int = 0  # Лічильник ходів
         self.first_symbol: Optional[str] = None  # Перший відкритий символ
         self.first_index: Optional[int] = None  # Індекс першої відкритої картки
         self.can_click: bool = True  # Чи можна клікати на картки зараз
+        self.last_mismatch: Optional[Tuple[int, int]] = None  # Картки, які треба закрити
+
+    @property
+    def symbols(self) -> List[str]:
+        """Список символів на картках (текстове подання для GUI)."""
+        return [symbol_name(symbol_id) for symbol_id in self.symbol_ids]
 
-    def setup_game(self, rows: int, cols: int) -> None:
+    def setup_game(self, rows: int, cols: int, seed: Optional[int] = None) -> None:
         """Ініціалізує гру з обраним рівнем складності.
 
         Args:
             rows (int): Кількість рядків сітки
             cols (int): Кількість стовпців сітки
+            seed (Optional[int]): 64-бітне зерно для розкладу карток (None - випадкове);
+                однакове зерно дає однакове поле, що дозволяє відтворювати ігри
 
         Дії:
             1. Встановлює розміри сітки
             2. Розраховує необхідну кількість пар символів
-            3. Генерує випадковий набір символів з emoji
+            3. Генерує випадковий набір ідентифікаторів символів
             4. Подвоює символи для створення пар та перемішує їх
+            5. На непарному полі залишає одну порожню картку, вже знайдену
         """
         self.rows = rows
         self.cols = cols
-        self.pairs_needed = (rows * cols) // 2
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        rng = random.Random(self.seed)
+        cards = rows * cols
+        self.pairs_needed = cards // 2
+
+        # Для малого поля - випадкові emoji, для великого - усі ідентифікатори поспіль
+        if self.pairs_needed <= len(EMOJI_SYMBOLS):
+            selected_ids = rng.sample(range(len(EMOJI_SYMBOLS)), self.pairs_needed)
+        else:
+            selected_ids = range(self.pairs_needed)
+        # Подвоюємо символи для пар та перемішуємо
+        self.symbol_ids = array("I", selected_ids)
+        self.symbol_ids.extend(self.symbol_ids)
+        if cards % 2:
+            self.symbol_ids.append(BLANK_ID)
+        rng.shuffle(self.symbol_ids)
+
+        self.revealed = bytearray((cards + 7) // 8)
+        self.matched = bytearray((cards + 7) // 8)
+        self.matched_pairs = 0
+        self.blank_index = self.symbol_ids.index(BLANK_ID) if cards % 2 else None
+        if self.blank_index is not None:
+            self._set_bit(self.matched, self.blank_index)
+        self.moves = 0
+        self.first_symbol = None
+        self.first_index = None
+        self.can_click = True
+        self.last_mismatch = None
 
-        emoji_symbols = ["🐶", "🐱", "🐭", "🐹", "🐰", "🦊", "🐻", "🐼",
-                         "🐨", "🐯", "🦁", "🐮", "🐷", "🐸", "🐵", "🐔",
-                         "🐧", "🐦", "🐤", "🦄", "🐝", "🐛", "🦋", "🐌"]
+    def restore(self, rows: int, cols: int, seed: int, symbol_ids: array, matched: bytearray,
+                moves: int, first_index: Optional[int] = None) -> None:
+        """Відновлює гру зі збереженого стану без повторного тасування.
 
-        # Вибираємо випадкові символи (кількість = pairs_needed)
-        selected_symbols = random.sample(emoji_symbols, self.pairs_needed)
-        # Подвоюємо символи для пар та перемішуємо
-        self.symbols = selected_symbols * 2
-        random.shuffle(self.symbols)
+        Args:
+            rows (int): Кількість рядків сітки
+            cols (int): Кількість стовпців сітки
+            seed (int): Зерно, з якого було розкладено поле
+            symbol_ids (array): Ідентифікатори символів на картках (масив "I")
+            matched (bytearray): Бітова множина знайдених карток (разом із порожньою)
+            moves (int): Кількість зроблених ходів
+            first_index (Optional[int]): Картка, відкрита першою в незавершеному ході
+        """
+        self.rows = rows
+        self.cols = cols
+        self.seed = seed
+        cards = rows * cols
+        self.pairs_needed = cards // 2
+        self.symbol_ids = symbol_ids
+        self.matched = matched
+        self.revealed = bytearray(len(matched))
+        self.blank_index = symbol_ids.index(BLANK_ID) if cards % 2 else None
+        # Кількість знайдених пар - за кількістю встановлених бітів (порожня картка пари не має)
+        matched_cards = bin(int.from_bytes(matched, "little")).count("1")
+        self.matched_pairs = (matched_cards - (self.blank_index is not None)) // 2
+        self.moves = moves
+        self.first_index = first_index
+        self.first_symbol = None
+        if first_index is not None:
+            self._set_bit(self.revealed, first_index)
+            self.first_symbol = symbol_name(symbol_ids[first_index])
+        self.can_click = True
+        self.last_mismatch = None
 
-    def handle_click(self, idx: int, button_text: str) -> Tuple[bool, Optional[int], str]:
+    @staticmethod
+    def _get_bit(bits: bytearray, idx: int) -> bool:
+        return bool(bits[idx >> 3] & (1 << (idx & 7)))
+
+    @staticmethod
+    def _set_bit(bits: bytearray, idx: int) -> None:
+        bits[idx >> 3] |= 1 << (idx & 7)
+
+    @staticmethod
+    def _clear_bit(bits: bytearray, idx: int) -> None:
+        bits[idx >> 3] &= ~(1 << (idx & 7)) & 0xFF
+
+    def is_revealed(self, idx: int) -> bool:
+        """Чи відкрита картка зараз (у поточному ході)."""
+        return self._get_bit(self.revealed, idx)
+
+    def is_matched(self, idx: int) -> bool:
+        """Чи картка вже в знайденій парі."""
+        return self._get_bit(self.matched, idx)
+
+    def handle_click(self, idx: int, button_text: Optional[str] = None) -> Tuple[bool, Optional[int], str]:
         """Обробляє клік на картку та повертає результат.
 
         Args:
             idx (int): Індекс клікнутої картки
-            button_text (str): Поточний текст на кнопці
+            button_text (Optional[str]): Текст на кнопці; не потрібен, стан карток
+                зберігає сама логіка, але якщо передано не "?" - клік ігнорується
 
         Returns:
             Tuple[bool, Optional[int], str]:
                 - bool: Чи знайдено пару
-                - Optional[int]: Індекс першої картки (якщо не знайдено пару)
+                - Optional[int]: Індекс першої картки (після другого кліку)
                 - str: Символ на клікнутій картці
 
         Логіка:
@@ -66,41 +181,53 @@ class MemoryGameLogic:
             3. Якщо це другий клік:
                - Збільшуємо лічильник ходів
                - Блокуємо подальші кліки
-               - Перевіряємо чи знайдено пару
+               - Перевіряємо чи знайдено пару та оновлюємо лічильник пар
         """
-        if not self.can_click or button_text != "?":
+        if (not self.can_click or (button_text is not None and button_text != "?")
+                or self._get_bit(self.revealed, idx) or self._get_bit(self.matched, idx)):
             return (False, None, "")
 
-        current_symbol = self.symbols[idx]
+        current_symbol = symbol_name(self.symbol_ids[idx])
+        self._set_bit(self.revealed, idx)
 
-        if self.first_symbol is None:  # Перший клік
+        if self.first_index is None:  # Перший клік
             self.first_symbol = current_symbol
             self.first_index = idx
             return (False, None, current_symbol)
         else:  # Другий клік
             self.moves += 1
             self.can_click = False
-
-            if self.first_symbol == current_symbol:  # Знайдено пару
-                return (True, None, current_symbol)
+            first_index = self.first_index
+            self.first_symbol = None
+            self.first_index = None
+
+            if self.symbol_ids[first_index] == self.symbol_ids[idx]:  # Знайдено пару
+                self._clear_bit(self.revealed, idx)
+                self._clear_bit(self.revealed, first_index)
+                self._set_bit(self.matched, idx)
+                self._set_bit(self.matched, first_index)
+                self.matched_pairs += 1
+                return (True, first_index, current_symbol)
             else:  # Не знайдено пару
-                first_index = self.first_index
-                self.first_symbol = None
-                self.first_index = None
+                self.last_mismatch = (first_index, idx)
                 return (False, first_index, current_symbol)
 
     def reset_turn(self) -> None:
-        """Скидає стан ходу після невдалої спроби знайти пару.
-        Дозволяє знову клікати на картки.
+        """Скидає стан ходу після спроби знайти пару.
+        Закриває картки невдалої спроби та дозволяє знову клікати.
         """
+        if self.last_mismatch:
+            for idx in self.last_mismatch:
+                self._clear_bit(self.revealed, idx)
+            self.last_mismatch = None
         self.can_click = True
 
-    def check_win(self, buttons_state: List[str]) -> bool:
-        """Перевіряє, чи всі пари знайдені (умова перемоги).
+    def check_win(self, buttons_state: Optional[List[str]] = None) -> bool:
+        """Перевіряє, чи всі пари знайдені (умова перемоги) за O(1).
 
         Args:
-            buttons_state (List[str]): Список станів кнопок
+            buttons_state (Optional[List[str]]): Не використовується, залишено для сумісності
         Returns:
-            bool: True якщо всі картки відкриті (стани = "disabled")
+            bool: True якщо знайдено всі пари
         """
-        return all(state == "disabled" for state in buttons_state)
\ No newline at end of file
+        return self.matched_pairs == self.pairs_needed
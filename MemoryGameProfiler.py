@@ -0,0 +1,171 @@
+import time
+import tkinter as tk
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Tuple
+
+_NULL_STAGE = nullcontext()  # Спільний порожній контекст, коли профілювання вимкнене
+MAX_TRACE_EVENTS = 1_000_000  # Обмеження розміру трасування в пам'яті
+
+
+class LatencyHistogram:
+    """Гістограма затримок з логарифмічними кошиками (степені двійки мікросекунд)."""
+
+    BUCKETS = 32
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        micros = int(seconds * 1e6)
+        self.counts[min(micros.bit_length(), self.BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        """Верхня межа кошика, в який потрапляє перцентиль q, у секундах."""
+        threshold = q / 100 * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= threshold:
+                return min((1 << bucket) / 1e6, self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class _Stage:
+    """Контекст вимірювання одного етапу."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "ClickProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self.profiler.record(self.name, self.start, time.perf_counter())
+
+
+class ClickProfiler:
+    def __init__(self, root: tk.Tk, enabled: bool = False, trace_path: Optional[str] = None):
+        """Профілювання шляху кліку та затримок циклу подій Tk.
+
+        Рахує гістограми тривалості етапів обробки кліку, затримку від кліку до
+        перемальовування, відставання циклу подій та за потреби пише трасування
+        у форматі Chrome Trace (chrome://tracing, Perfetto).
+        Args:
+            root: Головне вікно програми
+            enabled: Чи вмикати вимірювання (вимкнене майже нічого не коштує)
+            trace_path: Файл для трасування (None - без трасування)
+        """
+        self.root = root
+        self.enabled = enabled
+        self.trace_path = trace_path
+        self.stages: Dict[str, LatencyHistogram] = {}
+        self.trace: List[Tuple[str, float, float]] = []  # (етап, початок, кінець)
+        self.origin = time.perf_counter()
+        self.hud: Optional[tk.Label] = None
+        self.hud_visible = False
+        self.probe_interval_ms = 50
+
+    def stage(self, name: str):
+        """Контекстний менеджер для вимірювання етапу `name`."""
+        return _Stage(self, name) if self.enabled else _NULL_STAGE
+
+    def record(self, name: str, start: float, end: float) -> None:
+        """Додає вимір етапу в гістограму й трасування."""
+        histogram = self.stages.get(name)
+        if histogram is None:
+            histogram = self.stages[name] = LatencyHistogram()
+        histogram.add(end - start)
+        if self.trace_path and len(self.trace) < MAX_TRACE_EVENTS:
+            self.trace.append((name, start, end))
+
+    def click_started(self) -> None:
+        """Позначає початок кліку: кінець - коли виконано всі відкладені в idle оновлення й перемальовування."""
+        if self.enabled:
+            start = time.perf_counter()
+            self.root.after_idle(lambda: self._painted(start))
+
+    def _painted(self, start: float) -> None:
+        # Цей виклик поставлено в чергу idle ще до обробки кліку, тобто раніше за flush_updates,
+        # CanvasBoard._flush і перемальовування віджетів, яке вони самі планують в idle.
+        # update_idletasks виконує їх усі (разом із вкладеними), і лише тоді кінець вимірювання.
+        self.root.update_idletasks()
+        self.record("click_to_paint", start, time.perf_counter())
+
+    def start_loop_probe(self, interval_ms: int = 50) -> None:
+        """Запускає зонд відставання циклу подій: запізнення таймера after понад interval_ms."""
+        if not self.enabled:
+            return
+        self.probe_interval_ms = interval_ms
+        expected = time.perf_counter() + interval_ms / 1000
+
+        def probe() -> None:
+            now = time.perf_counter()
+            self.record("loop_lag", expected, max(now, expected))
+            self.start_loop_probe(interval_ms)
+
+        self.root.after(interval_ms, probe)
+
+    def toggle_hud(self, event: Optional[tk.Event] = None) -> None:
+        """Показує або ховає накладку з показниками продуктивності."""
+        if not self.enabled:
+            return
+        self.hud_visible = not self.hud_visible
+        if self.hud_visible:
+            self._refresh_hud()
+        elif self.hud is not None and self.hud.winfo_exists():
+            self.hud.place_forget()
+
+    def _refresh_hud(self) -> None:
+        if not self.hud_visible:
+            return
+        if self.hud is None or not self.hud.winfo_exists():
+            self.hud = tk.Label(self.root, font=("Courier", 9), justify="left", anchor="nw",
+                                bg="#000000", fg="#7CFC00")
+        self.hud.config(text=self.summary(("click_to_paint", "click", "loop_lag")))
+        self.hud.place(relx=1.0, rely=0.0, anchor="ne")
+        self.hud.lift()
+        self.root.after(250, self._refresh_hud)
+
+    def summary(self, names: Optional[Tuple[str, ...]] = None) -> str:
+        """Текстова таблиця p50/p95/p99/max для етапів (у мілісекундах)."""
+        lines = [f"{'stage':<22}{'n':>7}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}"]
+        for name in names or sorted(self.stages):
+            histogram = self.stages.get(name)
+            if histogram is None:
+                continue
+            lines.append(f"{name:<22}{histogram.count:>7}"
+                         f"{histogram.percentile(50) * 1000:>8.2f}{histogram.percentile(95) * 1000:>8.2f}"
+                         f"{histogram.percentile(99) * 1000:>8.2f}{histogram.max * 1000:>8.2f}")
+        return "\n".join(lines)
+
+    def dump(self) -> None:
+        """Записує трасування (Chrome Trace JSON) з гістограмами в метаданих."""
+        if not self.trace_path:
+            return
+        import json  # Потрібен лише при виході, не на старті
+        events = [
+            {"name": name, "ph": "X", "pid": 0, "tid": 0,
+             "ts": (start - self.origin) * 1e6, "dur": (end - start) * 1e6}
+            for name, start, end in self.trace
+        ]
+        histograms = {
+            name: {"count": h.count, "mean_ms": h.mean * 1000, "max_ms": h.max * 1000,
+                   "buckets_us_pow2": h.counts}
+            for name, h in self.stages.items()
+        }
+        with open(self.trace_path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms",
+                       "metadata": {"histograms": histograms}}, file)
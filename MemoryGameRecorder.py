@@ -0,0 +1,223 @@
+import argparse
+import os
+import random
+import struct
+import tempfile
+import time
+from array import array
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Tuple
+
+from MemoryGameLogic import MemoryGameLogic
+
+# Формат файлу записів:
+#   MAGIC, далі потік записів. Кожен запис починається з varint:
+#     0         - нова гра: varint рядків, varint стовпців, 8 байт зерна (<Q),
+#                 varint часу початку (мс від епохи)
+#     idx + 1   - клік по картці idx: далі varint затримки від попереднього кліку в мс
+MAGIC = b"MGREC\x01"
+_SEED = struct.Struct("<Q")
+
+
+def write_varint(buffer: bytearray, value: int) -> None:
+    """Дописує невід'ємне ціле у форматі LEB128 (7 біт на байт)."""
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Читає varint з data починаючи з pos.
+
+    Returns:
+        Tuple[int, int]: Значення та позиція після нього
+    """
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+class RecordedGame(NamedTuple):
+    """Одна записана гра: параметри поля та потік кліків."""
+    rows: int
+    cols: int
+    seed: int
+    started_at_ms: int  # Час початку гри, мс від епохи
+    clicks: array  # Індекси клікнутих карток
+    delays_ms: array  # Затримка кожного кліку від попереднього (або від початку гри), мс
+
+
+class GameRecorder:
+    def __init__(self, path: str, flush_every: int = 256):
+        """Записувач ігор у компактний бінарний журнал (дописує в кінець файлу).
+
+        Args:
+            path: Шлях до файлу журналу
+            flush_every: Через скільки кліків скидати буфер на диск
+        """
+        self.path = path
+        self.flush_every = flush_every
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file: BinaryIO = open(path, "ab")
+        self._buffer = bytearray(MAGIC if is_new else b"")
+        self._last_click: float = 0.0
+        self._pending_clicks = 0
+
+    def start_game(self, rows: int, cols: int, seed: int) -> None:
+        """Починає запис нової гри (викликається після MemoryGameLogic.setup_game)."""
+        write_varint(self._buffer, 0)
+        write_varint(self._buffer, rows)
+        write_varint(self._buffer, cols)
+        self._buffer += _SEED.pack(seed)
+        write_varint(self._buffer, int(time.time() * 1000))
+        self._last_click = time.monotonic()
+        self.flush()
+
+    def record_click(self, idx: int) -> None:
+        """Записує клік по картці (викликається з MemoryGameController.handle_click)."""
+        now = time.monotonic()
+        write_varint(self._buffer, idx + 1)
+        write_varint(self._buffer, int((now - self._last_click) * 1000))
+        self._last_click = now
+        self._pending_clicks += 1
+        if self._pending_clicks >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Скидає накопичені записи у файл."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._file.flush()
+            self._buffer.clear()
+        self._pending_clicks = 0
+
+    def close(self) -> None:
+        """Скидає буфер і закриває файл."""
+        self.flush()
+        self._file.close()
+
+
+def read_games(path: str) -> Iterator[RecordedGame]:
+    """Читає всі ігри з журналу.
+
+    Args:
+        path: Шлях до файлу журналу
+    Returns:
+        Iterator[RecordedGame]: Ігри в порядку запису
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"{path}: не журнал Memory Game")
+
+    pos = len(MAGIC)
+    game: Optional[RecordedGame] = None
+    while pos < len(data):
+        tag, pos = read_varint(data, pos)
+        if tag == 0:
+            if game is not None:
+                yield game
+            rows, pos = read_varint(data, pos)
+            cols, pos = read_varint(data, pos)
+            (seed,) = _SEED.unpack_from(data, pos)
+            pos += _SEED.size
+            started_at_ms, pos = read_varint(data, pos)
+            game = RecordedGame(rows, cols, seed, started_at_ms, array("I"), array("I"))
+        else:
+            delay, pos = read_varint(data, pos)
+            game.clicks.append(tag - 1)
+            game.delays_ms.append(delay)
+    if game is not None:
+        yield game
+
+
+def replay(game: RecordedGame, logic: Optional[MemoryGameLogic] = None) -> MemoryGameLogic:
+    """Відтворює гру в MemoryGameLogic без GUI і без затримок.
+
+    Повторює послідовність дій контролера: невдала пара закривається перед
+    наступним кліком, після знайденої пари хід скидається одразу.
+    Args:
+        game: Записана гра
+        logic: Об'єкт логіки для повторного використання (за замовчуванням новий)
+    Returns:
+        MemoryGameLogic: Логіка в стані після останнього кліку
+    """
+    logic = logic or MemoryGameLogic()
+    logic.setup_game(game.rows, game.cols, game.seed)
+    for idx in game.clicks:
+        if logic.last_mismatch:
+            logic.reset_turn()
+        is_match, _, _ = logic.handle_click(idx)
+        if is_match:
+            logic.reset_turn()
+    return logic
+
+
+def _synthetic_games(path: str, games: int, rows: int, cols: int) -> None:
+    """Записує випадкові, але завершені ігри для бенчмарку."""
+    recorder = GameRecorder(path)
+    logic = MemoryGameLogic()
+    for _ in range(games):
+        logic.setup_game(rows, cols)
+        recorder.start_game(rows, cols, logic.seed)
+        while not logic.check_win():
+            if logic.last_mismatch:
+                logic.reset_turn()
+            idx = random.randrange(rows * cols)
+            recorder.record_click(idx)
+            is_match, _, _ = logic.handle_click(idx)
+            if is_match:
+                logic.reset_turn()
+    recorder.close()
+
+
+def benchmark(games: int, rows: int, cols: int) -> None:
+    """Вимірює розмір журналу та швидкість відтворення ігор."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.mgrec")
+        _synthetic_games(path, games, rows, cols)
+        size = os.path.getsize(path)
+
+        start = time.perf_counter()
+        recorded: List[RecordedGame] = list(read_games(path))
+        decoded = time.perf_counter()
+        logic = MemoryGameLogic()
+        clicks = 0
+        wins = 0
+        for game in recorded:
+            wins += replay(game, logic).check_win()
+            clicks += len(game.clicks)
+        finished = time.perf_counter()
+
+    print(f"{games} ігор {rows}x{cols}, {clicks} кліків, журнал {size} байт "
+          f"({size / clicks:.2f} байт/клік), виграно {wins}")
+    print(f"декодування: {clicks / (decoded - start):,.0f} кліків/с")
+    print(f"відтворення: {games / (finished - decoded):,.0f} ігор/с, "
+          f"{clicks / (finished - decoded):,.0f} кліків/с")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Журнали ігор Memory Game: перегляд, відтворення, бенчмарк")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    replay_parser = subparsers.add_parser("replay", help="Відтворити всі ігри з журналу")
+    replay_parser.add_argument("path")
+    bench_parser = subparsers.add_parser("bench", help="Бенчмарк швидкості відтворення")
+    bench_parser.add_argument("--games", type=int, default=10000)
+    bench_parser.add_argument("--grid", default="5x6")
+    args = parser.parse_args()
+
+    if args.command == "replay":
+        for number, game in enumerate(read_games(args.path), 1):
+            logic = replay(game)
+            status = "won" if logic.check_win() else "unfinished"
+            print(f"#{number}: {game.rows}x{game.cols} seed={game.seed} "
+                  f"clicks={len(game.clicks)} moves={logic.moves} {status}")
+    else:
+        bench_rows, bench_cols = (int(value) for value in args.grid.lower().split("x"))
+        benchmark(args.games, bench_rows, bench_cols)
@@ -0,0 +1,255 @@
+import argparse
+import asyncio
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+from MemoryGameLogic import MemoryGameLogic, BLANK_ID
+
+# Протокол: по одному текстовому рядку на запит і відповідь
+#   NEW <rows> <cols> [seed]  -> OK <session> <cards>
+#   CLICK <session> <idx>     -> R <match 0|1> <first_index|-1> <symbol_id|-1> <moves> <won 0|1>
+#   END <session>             -> OK
+#   STATS                     -> OK <sessions>
+#   помилка                   -> ERR <повідомлення>
+# Поле будується в потоці циклу подій: 10 000 карток - ~5 мс, що не зупиняє інші сеанси
+MAX_CARDS = 10_000  # Обмеження розміру поля одного сеансу
+MAX_TOTAL_CARDS = 10_000_000  # Обмеження сумарної кількості карток усіх сеансів (~50 МБ)
+
+
+class Session:
+    """Стан однієї гри на сервері."""
+
+    __slots__ = ("logic", "last_active")
+
+    def __init__(self, logic: MemoryGameLogic, now: float):
+        self.logic = logic
+        self.last_active = now
+
+
+class GameServer:
+    def __init__(self, idle_timeout: float = 300.0, sweep_interval: float = 5.0):
+        """Asyncio-сервер багатьох незалежних ігор в одному процесі.
+
+        Усі сеанси живуть в одному потоці циклу подій, тож блокування не потрібні;
+        кожен клік змінює лише стан свого сеансу. Сеанси впорядковані за часом
+        останньої активності, тому прострочені знімаються з голови черги за O(k).
+        Args:
+            idle_timeout: Через скільки секунд бездіяльності сеанс видаляється
+            sweep_interval: Як часто перевіряти прострочені сеанси, с
+        """
+        self.idle_timeout = idle_timeout
+        self.sweep_interval = sweep_interval
+        self.sessions: "OrderedDict[int, Session]" = OrderedDict()
+        self.next_id = 1
+        self.total_cards = 0  # Сумарна кількість карток живих сеансів
+        self.expired = 0  # Скільки сеансів видалено через бездіяльність
+
+    def handle_line(self, line: str) -> str:
+        """Обробляє один рядок запиту та повертає рядок відповіді."""
+        parts = line.split()
+        if not parts:
+            return "ERR empty"
+        command = parts[0].upper()
+        now = time.monotonic()
+        try:
+            if command == "CLICK":
+                return self._click(int(parts[1]), int(parts[2]), now)
+            if command == "NEW":
+                rows, cols = int(parts[1]), int(parts[2])
+                if not (0 < rows * cols <= MAX_CARDS and rows > 0):
+                    return "ERR bad grid"
+                if self.total_cards + rows * cols > MAX_TOTAL_CARDS:
+                    return "ERR server full"
+                logic = MemoryGameLogic()
+                logic.setup_game(rows, cols, int(parts[3]) if len(parts) > 3 else None)
+                session_id = self.next_id
+                self.next_id += 1
+                self.sessions[session_id] = Session(logic, now)
+                self.total_cards += rows * cols
+                return f"OK {session_id} {rows * cols}"
+            if command == "END":
+                self._remove(self.sessions.pop(int(parts[1]), None))
+                return "OK"
+            if command == "STATS":
+                return f"OK {len(self.sessions)}"
+        except (IndexError, ValueError):
+            return "ERR bad request"
+        return "ERR unknown command"
+
+    def _remove(self, session: Optional[Session]) -> None:
+        """Звільняє картки видаленого сеансу з загального ліміту."""
+        if session is not None:
+            self.total_cards -= session.logic.rows * session.logic.cols
+
+    def _click(self, session_id: int, idx: int, now: float) -> str:
+        session = self.sessions.get(session_id)
+        if session is None:
+            return "ERR no session"
+        session.last_active = now
+        self.sessions.move_to_end(session_id)
+        logic = session.logic
+        if not 0 <= idx < logic.rows * logic.cols:
+            return "ERR bad index"
+        # Як у контролері: невдала пара закривається перед наступним кліком
+        if logic.last_mismatch:
+            logic.reset_turn()
+        is_match, first_index, symbol = logic.handle_click(idx)
+        if is_match:
+            logic.reset_turn()
+        symbol_id = logic.symbol_ids[idx] if symbol and logic.symbol_ids[idx] != BLANK_ID else -1
+        return (f"R {int(is_match)} {first_index if first_index is not None else -1} {symbol_id} "
+                f"{logic.moves} {int(logic.check_win())}")
+
+    def expire_idle(self) -> int:
+        """Видаляє сеанси, неактивні довше idle_timeout. Повертає кількість видалених."""
+        deadline = time.monotonic() - self.idle_timeout
+        removed = 0
+        while self.sessions:
+            session_id, session = next(iter(self.sessions.items()))
+            if session.last_active >= deadline:
+                break
+            del self.sessions[session_id]
+            self._remove(session)
+            removed += 1
+        self.expired += removed
+        return removed
+
+    async def _sweeper(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            self.expire_idle()
+
+    async def _serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                writer.write((self.handle_line(line.decode()) + "\n").encode())
+                # Чекаємо на буфер лише коли він переповнений (конвеєрні запити)
+                if writer.transport.get_write_buffer_size() > 65536:
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765, unix_path: Optional[str] = None) -> None:
+        """Запускає сервер і працює до скасування."""
+        if unix_path:
+            server = await asyncio.start_unix_server(self._serve_client, path=unix_path)
+        else:
+            server = await asyncio.start_server(self._serve_client, host, port)
+        sweeper = asyncio.ensure_future(self._sweeper())
+        print(f"READY {unix_path or f'{host}:{port}'}", flush=True)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            sweeper.cancel()
+
+
+async def _open(host: str, port: int, unix_path: Optional[str]):
+    if unix_path:
+        return await asyncio.open_unix_connection(unix_path)
+    return await asyncio.open_connection(host, port)
+
+
+async def _client(host: str, port: int, unix_path: Optional[str], sessions: int, rows: int, cols: int,
+                  clicks: int, latencies: List[float], rng: random.Random) -> int:
+    """Одне з'єднання навантажувача: створює свої сеанси й клікає по них по черзі."""
+    reader, writer = await _open(host, port, unix_path)
+
+    async def request(line: str) -> str:
+        writer.write((line + "\n").encode())
+        return (await reader.readline()).decode()
+
+    ids = []
+    for _ in range(sessions):
+        ids.append(int((await request(f"NEW {rows} {cols}")).split()[1]))
+    cards = rows * cols
+    won = 0
+    for _ in range(clicks):
+        for session_id in ids:
+            start = time.perf_counter()
+            reply = await request(f"CLICK {session_id} {rng.randrange(cards)}")
+            latencies.append(time.perf_counter() - start)
+            won += reply.endswith(" 1\n")
+    for session_id in ids:
+        await request(f"END {session_id}")
+    writer.close()
+    return won
+
+
+async def load_test(host: str, port: int, unix_path: Optional[str], sessions: int, connections: int,
+                    rows: int, cols: int, clicks: int) -> None:
+    """Генерує навантаження й друкує перцентилі затримки кліку."""
+    latencies: List[float] = []
+    rng = random.Random(0)
+    per_connection = [sessions // connections + (i < sessions % connections) for i in range(connections)]
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, unix_path, count, rows, cols, clicks, latencies, random.Random(rng.random()))
+        for count in per_connection if count
+    ))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    def percentile(q: float) -> float:
+        return latencies[min(len(latencies) - 1, int(q / 100 * len(latencies)))] * 1e6
+
+    print(f"{sessions} сеансів {rows}x{cols} одночасно, {connections} з'єднань, "
+          f"{len(latencies)} кліків за {elapsed:.2f} с ({len(latencies) / elapsed:,.0f} кліків/с)")
+    print(f"затримка кліку, мкс: p50={percentile(50):.0f} p90={percentile(90):.0f} "
+          f"p99={percentile(99):.0f} p99.9={percentile(99.9):.0f} max={latencies[-1] * 1e6:.0f}")
+
+
+def run_load_test_with_server(args: argparse.Namespace) -> None:
+    """Запускає сервер окремим процесом, навантажує його й рахує сеанси на секунду процесорного часу."""
+    command = [sys.executable, os.path.abspath(__file__), "serve", "--port", str(args.port)]
+    if args.unix:
+        command += ["--unix", args.unix]
+    server = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    try:
+        server.stdout.readline()  # Чекаємо на READY
+        asyncio.run(load_test("127.0.0.1", args.port, args.unix, args.sessions, args.connections,
+                              args.rows, args.cols, args.clicks))
+    finally:
+        server.terminate()
+        server.wait()
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = usage.ru_utime + usage.ru_stime
+    # Ділиться на процесорний час усіх потоків сервера, а не на кількість ядер
+    print(f"процесорний час сервера: {cpu:.2f} с, {args.sessions * args.clicks / cpu:,.0f} кліків на "
+          f"CPU-секунду, {args.sessions / cpu:,.0f} сеансів на CPU-секунду")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Asyncio-сервер Memory Game для багатьох сеансів")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name in ("serve", "load"):
+        sub = subparsers.add_parser(name)
+        sub.add_argument("--port", type=int, default=8765)
+        sub.add_argument("--unix", help="Шлях до Unix-сокета замість TCP")
+    subparsers.choices["serve"].add_argument("--idle-timeout", type=float, default=300.0)
+    load_parser = subparsers.choices["load"]
+    load_parser.add_argument("--sessions", type=int, default=5000)
+    load_parser.add_argument("--connections", type=int, default=50)
+    load_parser.add_argument("--clicks", type=int, default=40, help="Кліків на кожен сеанс")
+    load_parser.add_argument("--rows", type=int, default=5)
+    load_parser.add_argument("--cols", type=int, default=6)
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        try:
+            asyncio.run(GameServer(args.idle_timeout).serve(port=args.port, unix_path=args.unix))
+        except KeyboardInterrupt:
+            pass
+    else:
+        run_load_test_with_server(args)
@@ -0,0 +1,262 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+import argparse
+import time
+
+import numpy as np
+
+from MemoryGameLogic import MemoryGameLogic
+
+
+class PlayerModel(ABC):
+    """Базова модель гравця для пакетної симуляції.
+
+    Модель визначає лише те, які з уже побачених карток гравець пам'ятає.
+    Сама стратегія ходу однакова для всіх моделей: спершу забрати відому
+    пару, інакше відкрити невідому картку й добрати до неї відому пару,
+    а якщо її немає - відкрити ще одну невідому картку.
+    """
+
+    name: str = "base"
+
+    @abstractmethod
+    def known_mask(self, seen_at: np.ndarray, reveals: np.ndarray) -> np.ndarray:
+        """Повертає маску карток, які гравець пам'ятає.
+
+        Args:
+            seen_at: Номер відкриття, на якому картку бачили востаннє (-1 - не бачили), форма (B, N)
+            reveals: Кількість відкриттів карток у кожній грі, форма (B,)
+        Returns:
+            np.ndarray: Булева маска форми (B, N)
+        """
+
+
+class RandomPlayer(PlayerModel):
+    """Гравець без пам'яті: щоразу відкриває дві випадкові картки."""
+
+    name = "random"
+
+    def known_mask(self, seen_at: np.ndarray, reveals: np.ndarray) -> np.ndarray:
+        return np.zeros(seen_at.shape, dtype=bool)
+
+
+class PerfectMemoryPlayer(PlayerModel):
+    """Гравець з ідеальною пам'яттю: пам'ятає кожну відкриту картку."""
+
+    name = "perfect"
+
+    def known_mask(self, seen_at: np.ndarray, reveals: np.ndarray) -> np.ndarray:
+        return seen_at >= 0
+
+
+class LimitedMemoryPlayer(PlayerModel):
+    """Гравець з обмеженою пам'яттю: пам'ятає лише останні `capacity` відкриттів."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.name = f"limited-{capacity}"
+
+    def known_mask(self, seen_at: np.ndarray, reveals: np.ndarray) -> np.ndarray:
+        return (seen_at >= 0) & (seen_at >= (reveals - self.capacity)[:, None])
+
+
+# Доступні моделі гравців для командного рядка
+PLAYER_MODELS: Dict[str, PlayerModel] = {
+    "random": RandomPlayer(),
+    "perfect": PerfectMemoryPlayer(),
+    "limited": LimitedMemoryPlayer(6),
+}
+
+
+class BatchSimulator:
+    def __init__(self, player: PlayerModel, seed: Optional[int] = None):
+        """Headless-симулятор, що грає одразу пакет ігор у векторизованому вигляді.
+
+        Args:
+            player: Модель гравця
+            seed: Зерно генератора випадкових чисел (для відтворюваності)
+        """
+        self.player = player
+        self.rng = np.random.default_rng(seed)
+
+    def deal(self, games: int, pairs: int) -> np.ndarray:
+        """Генерує перемішані поля для пакету ігор.
+
+        Args:
+            games: Кількість ігор у пакеті
+            pairs: Кількість пар на кожному полі
+        Returns:
+            np.ndarray: Ідентифікатори символів форми (games, 2 * pairs)
+        """
+        order = np.argsort(self.rng.random((games, 2 * pairs)), axis=1)
+        return (order // 2).astype(np.int32)
+
+    def play(self, boards: np.ndarray, max_moves: Optional[int] = None) -> np.ndarray:
+        """Грає всі поля пакету до перемоги.
+
+        Args:
+            boards: Ідентифікатори символів форми (B, N), кожен символ рівно двічі
+            max_moves: Обмеження кількості ходів (за замовчуванням 50 * N)
+        Returns:
+            np.ndarray: Кількість ходів у кожній грі, форма (B,)
+        """
+        games, cards = boards.shape
+        pairs = cards // 2
+        rows = np.arange(games)
+        if max_moves is None:
+            max_moves = 50 * cards
+
+        # Позиції обох карток кожного символу: partner[b, i] - друга картка пари
+        order = np.argsort(boards, axis=1, kind="stable")
+        first_pos = order[:, 0::2]
+        second_pos = order[:, 1::2]
+        partner = np.empty_like(order)
+        partner[rows[:, None], first_pos] = second_pos
+        partner[rows[:, None], second_pos] = first_pos
+
+        matched = np.zeros((games, cards), dtype=bool)
+        seen_at = np.full((games, cards), -1, dtype=np.int64)
+        reveals = np.zeros(games, dtype=np.int64)
+        moves = np.zeros(games, dtype=np.int64)
+        found = np.zeros(games, dtype=np.int64)
+
+        result = np.zeros(games, dtype=np.int64)
+        origin = np.arange(games)  # Індекси ігор у вихідному пакеті
+
+        for _ in range(max_moves):
+            active = found < pairs
+            if not active.any():
+                break
+            # Завершені ігри викидаємо з пакету, щоб не рахувати їх на кожному кроці
+            if active.sum() * 2 < active.size:
+                result[origin[~active]] = moves[~active]
+                origin, boards, partner = origin[active], boards[active], partner[active]
+                first_pos, second_pos = first_pos[active], second_pos[active]
+                matched, seen_at = matched[active], seen_at[active]
+                reveals, moves, found = reveals[active], moves[active], found[active]
+                games = origin.size
+                rows = np.arange(games)
+                active = np.ones(games, dtype=bool)
+            known = self.player.known_mask(seen_at, reveals) & ~matched
+
+            # 1. Відома пара: обидві картки символу в пам'яті
+            pair_known = known[rows[:, None], first_pos] & known[rows[:, None], second_pos]
+            has_pair = pair_known.any(axis=1)
+            pair_card = first_pos[rows, pair_known.argmax(axis=1)]
+
+            # 2. Інакше - випадкова невідома картка (або будь-яка, якщо невідомих немає)
+            unknown = ~matched & ~known
+            first_score = np.where(~matched, self.rng.random((games, cards)) + unknown, -1.0)
+            new_card = first_score.argmax(axis=1)
+            first = np.where(has_pair, pair_card, new_card)
+
+            # 3. Друга картка: відомий партнер або ще одна невідома картка
+            first_partner = partner[rows, first]
+            partner_known = known[rows, first_partner] | has_pair
+            second_score = np.where(~matched, self.rng.random((games, cards)) + unknown, -1.0)
+            second_score[rows, first] = -1.0
+            second = np.where(partner_known, first_partner, second_score.argmax(axis=1))
+
+            is_match = active & (boards[rows, first] == boards[rows, second])
+            active_rows = rows[active]
+            seen_at[active_rows, first[active]] = reveals[active]
+            seen_at[active_rows, second[active]] = reveals[active] + 1
+            reveals += 2 * active
+            moves += active
+            found += is_match
+            matched[rows[is_match], first[is_match]] = True
+            matched[rows[is_match], second[is_match]] = True
+
+        result[origin] = moves
+        return result
+
+    def simulate(self, games: int, rows: int, cols: int, batch_size: int = 10000) -> np.ndarray:
+        """Симулює задану кількість ігор на сітці rows x cols.
+
+        Args:
+            games: Загальна кількість ігор
+            rows: Кількість рядків сітки
+            cols: Кількість стовпців сітки
+            batch_size: Розмір одного векторизованого пакету
+        Returns:
+            np.ndarray: Кількість ходів у кожній грі
+        """
+        pairs = (rows * cols) // 2
+        results: List[np.ndarray] = []
+        remaining = games
+        while remaining > 0:
+            size = min(batch_size, remaining)
+            results.append(self.play(self.deal(size, pairs)))
+            remaining -= size
+        return np.concatenate(results) if results else np.zeros(0, dtype=np.int64)
+
+
+def summarize(moves: np.ndarray) -> Dict[str, float]:
+    """Зведена статистика розподілу кількості ходів.
+
+    Args:
+        moves: Кількість ходів у кожній грі
+    Returns:
+        Dict[str, float]: Середнє, стандартне відхилення, мінімум, перцентилі, максимум
+    """
+    p10, p50, p90, p99 = np.percentile(moves, [10, 50, 90, 99])
+    return {
+        "games": float(moves.size),
+        "mean": float(moves.mean()),
+        "std": float(moves.std()),
+        "min": float(moves.min()),
+        "p10": float(p10),
+        "p50": float(p50),
+        "p90": float(p90),
+        "p99": float(p99),
+        "max": float(moves.max()),
+    }
+
+
+def difficulty_report(player: PlayerModel, games: int, seed: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+    """Розподіл кількості ходів для кожного рівня складності MemoryGameLogic.
+
+    Args:
+        player: Модель гравця
+        games: Кількість ігор на кожен рівень
+        seed: Зерно генератора випадкових чисел
+    Returns:
+        Dict[str, Dict[str, float]]: Статистика для кожного рівня
+    """
+    simulator = BatchSimulator(player, seed)
+    return {
+        level: summarize(simulator.simulate(games, rows, cols))
+        for level, (rows, cols) in MemoryGameLogic().difficulty_levels.items()
+    }
+
+
+def benchmark(player: PlayerModel, games: int, rows: int, cols: int, batch_size: int = 10000) -> float:
+    """Вимірює пропускну здатність симулятора.
+
+    Returns:
+        float: Кількість ігор за секунду
+    """
+    simulator = BatchSimulator(player, seed=0)
+    start = time.perf_counter()
+    simulator.simulate(games, rows, cols, batch_size)
+    return games / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Пакетна симуляція Memory Game без GUI")
+    parser.add_argument("--player", choices=sorted(PLAYER_MODELS), action="append",
+                        help="Модель гравця (можна вказати кілька разів)")
+    parser.add_argument("--games", type=int, default=100000, help="Кількість ігор на рівень")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--benchmark", action="store_true", help="Виміряти кількість ігор за секунду")
+    args = parser.parse_args()
+
+    for name in args.player or sorted(PLAYER_MODELS):
+        player = PLAYER_MODELS[name]
+        for level, stats in difficulty_report(player, args.games, args.seed).items():
+            print(f"{player.name:>10} {level:>7}: " +
+                  " ".join(f"{key}={value:.2f}" for key, value in stats.items()))
+        if args.benchmark:
+            for level, (rows, cols) in MemoryGameLogic().difficulty_levels.items():
+                rate = benchmark(player, args.games, rows, cols)
+                print(f"{player.name:>10} {level:>7}: {rate:,.0f} games/s")
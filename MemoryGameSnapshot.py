@@ -0,0 +1,260 @@
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections import Counter
+from typing import NamedTuple, Optional, Tuple
+
+from MemoryGameLogic import MemoryGameLogic, BLANK_ID, EMOJI_SYMBOLS
+
+DEFAULT_SNAPSHOT_PATH = os.path.join(os.path.expanduser("~"), ".local", "share", "memory_game", "autosave.snap")
+
+# Формат знімка (little-endian, фіксоване розташування):
+#   заголовок: magic, рядки, стовпці, зерно, ходи, перша відкрита картка (-1 - немає), час гри в секундах
+#   ідентифікатори символів: rows*cols x uint32
+#   бітова множина знайдених карток: (rows*cols + 7) // 8 байтів
+MAGIC = b"MGSNP\x01"
+HEADER = struct.Struct("<6s2xIIQIid")
+
+_DISCARD = object()  # Позначка для письменника: видалити знімок замість запису
+
+
+class Snapshot(NamedTuple):
+    rows: int
+    cols: int
+    seed: int
+    moves: int
+    first_index: Optional[int]
+    elapsed: float
+    symbol_ids: array
+    matched: bytearray
+
+    def restore_into(self, logic: MemoryGameLogic) -> None:
+        """Відновлює стан гри в об'єкт логіки."""
+        logic.restore(self.rows, self.cols, self.seed, self.symbol_ids, self.matched,
+                      self.moves, self.first_index)
+
+
+def _ids_bytes(symbol_ids: array) -> bytes:
+    """Ідентифікатори символів у little-endian незалежно від платформи."""
+    if sys.byteorder == "little":
+        return symbol_ids.tobytes()
+    swapped = array("I", symbol_ids)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def _valid_layout(symbol_ids: array, matched: bytearray, cards: int, first_index: int) -> bool:
+    """Чи розклад можна відновити: кожен символ рівно двічі, порожня картка є лише на непарному
+    полі (одна й знайдена), ідентифікатори в межах, яких чекають логіка й KnowledgeTracker,
+    зайві біти множини нульові, а відкрита перша картка ходу ще не знайдена."""
+    if matched[-1] >> (cards - 1) % 8 + 1:
+        return False
+    if first_index >= 0 and MemoryGameLogic._get_bit(matched, first_index):
+        return False
+    counts = Counter(symbol_ids)  # Підрахунок на рівні C; масив знімка не змінюється
+    if counts.pop(BLANK_ID, 0) != cards % 2:
+        return False
+    if cards % 2 and not MemoryGameLogic._get_bit(matched, symbol_ids.index(BLANK_ID)):
+        return False
+    if max(counts, default=0) >= max(len(EMOJI_SYMBOLS), cards // 2):
+        return False
+    return set(counts.values()) <= {2}
+
+
+def load_snapshot(path: str = DEFAULT_SNAPSHOT_PATH) -> Optional[Snapshot]:
+    """Читає знімок через mmap; повертає None, якщо знімка немає або він пошкоджений."""
+    try:
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < HEADER.size:
+                return None
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                magic, rows, cols, seed, moves, first_index, elapsed = HEADER.unpack_from(mapped)
+                cards = rows * cols
+                ids_end = HEADER.size + 4 * cards
+                if magic != MAGIC or cards == 0 or size != ids_end + (cards + 7) // 8:
+                    return None
+                if not -1 <= first_index < cards:
+                    return None
+                view = memoryview(mapped)
+                try:
+                    # Один memcpy на масив замість розбору поелементно
+                    symbol_ids = array("I")
+                    symbol_ids.frombytes(view[HEADER.size:ids_end])
+                    matched = bytearray(view[ids_end:])
+                finally:
+                    view.release()
+    except (OSError, ValueError, struct.error):
+        return None
+    if sys.byteorder != "little":
+        symbol_ids.byteswap()
+    if not _valid_layout(symbol_ids, matched, rows * cols, first_index):
+        return None
+    return Snapshot(rows, cols, seed, moves, None if first_index < 0 else first_index, elapsed,
+                    symbol_ids, matched)
+
+
+class SnapshotWriter:
+    def __init__(self, path: str = DEFAULT_SNAPSHOT_PATH):
+        """Автозбереження гри у фоновому потоці.
+
+        save() лише копіює бітову множину знайдених карток і пакує заголовок;
+        файл атомарно (тимчасовий файл + os.replace) пише фоновий потік. Якщо
+        поки триває запис надійшло кілька знімків, пишеться лише останній.
+        Args:
+            path: Шлях до файлу знімка
+        """
+        self.path = path
+        self.writes = 0  # Скільки знімків записано на диск
+        self._ids = b""  # Ідентифікатори символів поточної гри (не змінюються протягом гри)
+        self._pending: object = None  # Останній незаписаний знімок або _DISCARD
+        self._busy = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._writer = threading.Thread(target=self._write_loop, name="snapshot-writer", daemon=True)
+        self._writer.start()
+
+    def start_game(self, logic: MemoryGameLogic) -> None:
+        """Запам'ятовує розклад нової гри (копіюється один раз, а не на кожен хід)."""
+        self._ids = _ids_bytes(logic.symbol_ids)
+
+    def save(self, logic: MemoryGameLogic, elapsed: float) -> None:
+        """Ставить знімок поточного стану на запис (не блокує).
+
+        Args:
+            logic: Логіка гри
+            elapsed: Скільки секунд триває гра
+        """
+        first_index = logic.first_index if logic.first_index is not None else -1
+        header = HEADER.pack(MAGIC, logic.rows, logic.cols, logic.seed, logic.moves, first_index, elapsed)
+        self._submit((header, self._ids, bytes(logic.matched)))
+
+    def discard(self) -> None:
+        """Видаляє знімок (гру завершено); виконується після вже поставлених записів."""
+        self._submit(_DISCARD)
+
+    def _submit(self, item: object) -> None:
+        with self._condition:
+            self._pending = item
+            self._condition.notify_all()
+
+    def _write_loop(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                item, self._pending = self._pending, None
+                self._busy = True
+            try:
+                if item is _DISCARD:
+                    self._remove()
+                else:
+                    self._write(item)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _write(self, parts: Tuple[bytes, bytes, bytes]) -> None:
+        tmp_path = self.path + ".tmp"
+        try:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "wb") as file:
+                for part in parts:
+                    file.write(part)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self.path)  # Атомарно: на диску завжди цілий знімок
+            self.writes += 1
+        except OSError:
+            pass  # Автозбереження не варте падіння гри
+
+    def _remove(self) -> None:
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def flush(self) -> None:
+        """Чекає, доки останній поставлений знімок буде записано."""
+        with self._condition:
+            while self._pending is not None or self._busy:
+                self._condition.wait()
+
+    def close(self) -> None:
+        """Дописує останній знімок і зупиняє фоновий потік."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._writer.join()
+
+
+def benchmark(rows: int, cols: int, saves: int) -> None:
+    """Вимірює ціну save() для циклу подій, швидкість запису та відновлення зі знімка."""
+    import random
+    import tempfile
+    import time
+
+    logic = MemoryGameLogic()
+    logic.setup_game(rows, cols, seed=1)
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = SnapshotWriter(os.path.join(tmp, "bench.snap"))
+        writer.start_game(logic)
+        samples = []
+        start = time.perf_counter()
+        for _ in range(saves):
+            logic._set_bit(logic.matched, rng.randrange(rows * cols))
+            logic.moves += 1
+            call = time.perf_counter()
+            writer.save(logic, 1.0)
+            samples.append(time.perf_counter() - call)
+        writer.flush()
+        elapsed = time.perf_counter() - start
+        samples.sort()
+        size = os.path.getsize(writer.path)
+        print(f"{rows}x{cols}: знімок {size / 1024:.0f} КіБ; save() median={samples[len(samples) // 2] * 1e6:.1f} мкс "
+              f"max={samples[-1] * 1e6:.1f} мкс; {saves} збережень -> {writer.writes} записів за {elapsed:.2f} с")
+
+        start = time.perf_counter()
+        snapshot = load_snapshot(writer.path)
+        restored = MemoryGameLogic()
+        snapshot.restore_into(restored)
+        resumed = time.perf_counter() - start
+        start = time.perf_counter()
+        MemoryGameLogic().setup_game(rows, cols, seed=1)
+        dealt = time.perf_counter() - start
+        assert restored.symbol_ids == logic.symbol_ids and restored.matched == logic.matched
+        print(f"відновлення зі знімка {resumed * 1000:.2f} мс (mmap + restore), "
+              f"повторне тасування з зерна {dealt * 1000:.2f} мс")
+        writer.close()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Знімки автозбереження Memory Game")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    show_parser = subparsers.add_parser("show", help="Показати вміст знімка")
+    show_parser.add_argument("path", nargs="?", default=DEFAULT_SNAPSHOT_PATH)
+    bench_parser = subparsers.add_parser("bench", help="Бенчмарк збереження та відновлення")
+    bench_parser.add_argument("--rows", type=int, default=1000)
+    bench_parser.add_argument("--cols", type=int, default=1000)
+    bench_parser.add_argument("--saves", type=int, default=2000)
+    args = parser.parse_args()
+
+    if args.command == "show":
+        shown = load_snapshot(args.path)
+        if shown is None:
+            print("знімка немає або він пошкоджений")
+        else:
+            matched = bin(int.from_bytes(shown.matched, "little")).count("1")
+            print(f"{shown.rows}x{shown.cols}, seed={shown.seed}, ходів {shown.moves}, "
+                  f"знайдено карток {matched}, перша відкрита {shown.first_index}, {shown.elapsed:.1f} с гри")
+    else:
+        benchmark(args.rows, args.cols, args.saves)
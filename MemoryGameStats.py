@@ -0,0 +1,280 @@
+import os
+import queue
+import random
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+DEFAULT_DB_PATH = os.path.join(os.path.expanduser("~"), ".local", "share", "memory_game", "stats.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    finished_at REAL NOT NULL,
+    difficulty TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    cols INTEGER NOT NULL,
+    moves INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    seed INTEGER NOT NULL
+);
+-- Таблиця лідерів: найменше ходів, за рівності - найшвидше
+CREATE INDEX IF NOT EXISTS games_leaderboard ON games (difficulty, moves, duration);
+CREATE INDEX IF NOT EXISTS games_duration ON games (difficulty, duration);
+-- Гістограма ходів, яку письменник оновлює в тій самій транзакції:
+-- перцентилі й ранги ходів рахуються за кількома сотнями рядків, а не мільйонами
+CREATE TABLE IF NOT EXISTS moves_histogram (
+    difficulty TEXT NOT NULL,
+    moves INTEGER NOT NULL,
+    games INTEGER NOT NULL,
+    PRIMARY KEY (difficulty, moves)
+) WITHOUT ROWID;
+-- Так само для тривалості, з кошиками по секунді
+CREATE TABLE IF NOT EXISTS duration_histogram (
+    difficulty TEXT NOT NULL,
+    seconds INTEGER NOT NULL,
+    games INTEGER NOT NULL,
+    PRIMARY KEY (difficulty, seconds)
+) WITHOUT ROWID;
+"""
+
+_INSERT_GAME = ("INSERT INTO games (finished_at, difficulty, rows, cols, moves, duration, seed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)")
+_UPDATE_HISTOGRAM = ("INSERT INTO moves_histogram (difficulty, moves, games) VALUES (?, ?, 1) "
+                     "ON CONFLICT (difficulty, moves) DO UPDATE SET games = games + 1")
+_UPDATE_DURATIONS = ("INSERT INTO duration_histogram (difficulty, seconds, games) VALUES (?, ?, 1) "
+                     "ON CONFLICT (difficulty, seconds) DO UPDATE SET games = games + 1")
+
+GameRow = Tuple[float, str, int, int, int, float, int]
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")  # У режимі WAL безпечно й без fsync на кожну транзакцію
+    return connection
+
+
+class StatsStore:
+    def __init__(self, path: str = DEFAULT_DB_PATH, batch_size: int = 1000, flush_interval: float = 0.5):
+        """Локальне сховище статистики ігор на SQLite (режим WAL).
+
+        Записи ставляться в чергу і пишуться фоновим потоком пакетами, тож
+        ні конструктор, ні record_game не торкаються диска й безпечні для циклу
+        подій Tk. Запити виконуються через окреме з'єднання для читання.
+        Args:
+            path: Шлях до файлу бази даних
+            batch_size: Максимальна кількість записів в одній транзакції
+            flush_interval: Скільки секунд письменник чекає на добір пакету
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Optional[GameRow]]" = queue.Queue()
+        self._schema_ready = threading.Event()  # Письменник створив базу та схему (або не зміг)
+        self._error: Optional[Exception] = None  # Чому письменник не зміг відкрити базу
+        self._reader: Optional[sqlite3.Connection] = None
+        self._reader_lock = threading.Lock()
+        self._writer = threading.Thread(target=self._write_loop, name="stats-writer", daemon=True)
+        self._writer.start()
+
+    def record_game(self, difficulty: str, rows: int, cols: int, moves: int, duration: float,
+                    seed: int, finished_at: Optional[float] = None) -> None:
+        """Ставить завершену гру в чергу на запис (не блокує).
+
+        Args:
+            difficulty: Назва рівня складності
+            rows: Кількість рядків
+            cols: Кількість стовпців
+            moves: Кількість ходів
+            duration: Тривалість гри в секундах
+            seed: 64-бітне зерно поля
+            finished_at: Час завершення (за замовчуванням зараз)
+        """
+        # SQLite зберігає знакові 64-бітні цілі
+        signed_seed = seed - (1 << 64) if seed >= 1 << 63 else seed
+        self._queue.put((finished_at or time.time(), difficulty, rows, cols, moves, duration, signed_seed))
+
+    def _write_loop(self) -> None:
+        """Фоновий письменник: збирає записи з черги та пише їх пакетами."""
+        try:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            connection = _connect(self.path)
+            connection.executescript(_SCHEMA)
+        except (OSError, sqlite3.Error) as error:
+            self._error = error  # Повідомляється з flush() і запитів, щоб вони не чекали вічно
+            return
+        finally:
+            self._schema_ready.set()
+        running = True
+        while running:
+            batch: List[GameRow] = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            running = item is not None
+            if batch:
+                try:
+                    with connection:
+                        connection.executemany(_INSERT_GAME, batch)
+                        connection.executemany(_UPDATE_HISTOGRAM, [(row[1], row[4]) for row in batch])
+                        connection.executemany(_UPDATE_DURATIONS,
+                                               [(row[1], int(row[5] + 0.5)) for row in batch])
+                except sqlite3.Error:
+                    pass  # Статистика не варта падіння гри: пакет втрачається, письменник працює далі
+            for _ in range(len(batch) + (not running)):
+                self._queue.task_done()
+        connection.close()
+
+    def _check_writer(self) -> None:
+        """Чекає на схему; якщо письменник не зміг відкрити базу - піднімає його помилку."""
+        self._schema_ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    def flush(self) -> None:
+        """Чекає, доки всі поставлені в чергу записи потраплять у базу."""
+        self._check_writer()
+        self._queue.join()
+
+    def close(self) -> None:
+        """Дописує чергу та закриває сховище."""
+        self._queue.put(None)
+        self._writer.join()
+        if self._reader is not None:
+            self._reader.close()
+
+    def _query(self, sql: str, params: tuple) -> List[tuple]:
+        self._check_writer()
+        with self._reader_lock:
+            if self._reader is None:
+                self._reader = _connect(self.path)
+            return self._reader.execute(sql, params).fetchall()
+
+    def leaderboard(self, difficulty: str, limit: int = 10) -> List[Tuple[int, float, float, int]]:
+        """Найкращі ігри рівня (за індексом games_leaderboard).
+
+        Returns:
+            List[Tuple[int, float, float, int]]: (ходи, тривалість, час завершення, зерно)
+        """
+        rows = self._query(
+            "SELECT moves, duration, finished_at, seed FROM games WHERE difficulty = ? "
+            "ORDER BY moves, duration LIMIT ?", (difficulty, limit))
+        return [(moves, duration, finished_at, seed % (1 << 64)) for moves, duration, finished_at, seed in rows]
+
+    def games_count(self, difficulty: str) -> int:
+        """Кількість записаних ігор рівня."""
+        return self._query("SELECT COALESCE(SUM(games), 0) FROM moves_histogram WHERE difficulty = ?",
+                           (difficulty,))[0][0]
+
+    def moves_percentile(self, difficulty: str, q: float) -> Optional[int]:
+        """Перцентиль кількості ходів за гістограмою.
+
+        Args:
+            difficulty: Назва рівня
+            q: Перцентиль від 0 до 100
+        """
+        histogram = self._query("SELECT moves, games FROM moves_histogram WHERE difficulty = ? ORDER BY moves",
+                                (difficulty,))
+        total = sum(games for _, games in histogram)
+        seen = 0
+        for moves, games in histogram:
+            seen += games
+            if seen >= q / 100 * total:
+                return moves
+        return None
+
+    def moves_rank(self, difficulty: str, moves: int) -> float:
+        """Частка ігор рівня (0..1), зіграних гірше, ніж за moves ходів."""
+        worse, total = self._query(
+            "SELECT COALESCE(SUM(CASE WHEN moves > ? THEN games END), 0), COALESCE(SUM(games), 0) "
+            "FROM moves_histogram WHERE difficulty = ?", (moves, difficulty))[0]
+        return worse / total if total else 0.0
+
+    def duration_percentile(self, difficulty: str, q: float) -> Optional[float]:
+        """Перцентиль тривалості гри за гістограмою, з точністю до секунди.
+
+        Args:
+            difficulty: Назва рівня
+            q: Перцентиль від 0 до 100
+        """
+        histogram = self._query(
+            "SELECT seconds, games FROM duration_histogram WHERE difficulty = ? ORDER BY seconds", (difficulty,))
+        total = sum(games for _, games in histogram)
+        seen = 0
+        for seconds, games in histogram:
+            seen += games
+            if seen >= q / 100 * total:
+                return float(seconds)
+        return None
+
+
+def benchmark(games: int) -> None:
+    """Вимірює швидкість вставки та затримку запитів на великій базі."""
+    levels = {"Easy": (3, 4, 9), "Medium": (4, 5, 16), "Hard": (5, 6, 24)}
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = StatsStore(os.path.join(tmp, "bench.db"), batch_size=10000)
+        start = time.perf_counter()
+        enqueue_max = 0.0
+        for _ in range(games):
+            level = rng.choice(list(levels))
+            rows, cols, par = levels[level]
+            call = time.perf_counter()
+            store.record_game(level, rows, cols, par + int(rng.expovariate(0.2)), rng.uniform(20, 300),
+                              rng.getrandbits(64))
+            enqueue_max = max(enqueue_max, time.perf_counter() - call)
+        enqueued = time.perf_counter()
+        store.flush()
+        written = time.perf_counter()
+        print(f"{games:,} ігор: постановка в чергу {games / (enqueued - start):,.0f}/с "
+              f"(макс. {enqueue_max * 1e6:.0f} мкс на виклик), запис на диск {games / (written - start):,.0f}/с")
+
+        queries: Dict[str, Callable[[], object]] = {
+            "leaderboard top-10": lambda: store.leaderboard("Hard"),
+            "moves p90": lambda: store.moves_percentile("Hard", 90),
+            "moves rank": lambda: store.moves_rank("Hard", 30),
+            "duration p50": lambda: store.duration_percentile("Hard", 50),
+        }
+        for name, query in queries.items():
+            samples = []
+            for _ in range(50):
+                call = time.perf_counter()
+                query()
+                samples.append((time.perf_counter() - call) * 1000)
+            print(f"{name:>20}: median={statistics.median(samples):.3f} ms max={max(samples):.3f} ms")
+        store.close()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Статистика ігор Memory Game")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    top_parser = subparsers.add_parser("top", help="Таблиця лідерів рівня")
+    top_parser.add_argument("difficulty")
+    top_parser.add_argument("--db", default=DEFAULT_DB_PATH)
+    bench_parser = subparsers.add_parser("bench", help="Бенчмарк вставки та запитів")
+    bench_parser.add_argument("--games", type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    if args.command == "top":
+        stats_store = StatsStore(args.db)
+        for place, (moves, duration, finished_at, seed) in enumerate(stats_store.leaderboard(args.difficulty), 1):
+            print(f"{place:2d}. {moves} ходів, {duration:.1f} с, "
+                  f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(finished_at))}, seed={seed}")
+        for q in (50, 90, 99):
+            print(f"p{q}: {stats_store.moves_percentile(args.difficulty, q)} ходів")
+        stats_store.close()
+    else:
+        benchmark(args.games)
@@ -0,0 +1,208 @@
+import math
+import os
+import tkinter as tk
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Палітри тем: кольори фігур на картках
+THEMES: Dict[str, List[str]] = {
+    "default": ["#e63946", "#f4a261", "#2a9d8f", "#264653", "#8338ec", "#ff006e",
+                "#3a86ff", "#fb5607", "#6a994e", "#bc6c25", "#7209b7", "#0077b6"],
+    "high-contrast": ["#000000", "#d00000", "#0033cc", "#008000", "#8000a0", "#b35900"],
+}
+
+SHAPES = ("circle", "square", "diamond", "triangle", "ring", "cross", "hexagon", "bar")
+
+# Піксельний шрифт 3x5 для номера варіанта та знака питання на звороті картки
+_GLYPHS: Dict[str, Tuple[str, ...]] = {
+    "0": ("111", "101", "101", "101", "111"), "1": ("010", "110", "010", "010", "111"),
+    "2": ("111", "001", "111", "100", "111"), "3": ("111", "001", "111", "001", "111"),
+    "4": ("101", "101", "111", "001", "001"), "5": ("111", "100", "111", "001", "111"),
+    "6": ("111", "100", "111", "101", "111"), "7": ("111", "001", "010", "010", "010"),
+    "8": ("111", "101", "111", "101", "111"), "9": ("111", "101", "111", "001", "111"),
+    "?": ("111", "001", "011", "000", "010"),
+}
+
+
+def describe(symbol_id: int, colors: int) -> Tuple[str, int, int]:
+    """Розкладає ідентифікатор символу на (фігура, номер кольору, варіант).
+
+    Кожна комбінація унікальна, а варіант (номер, що малюється в куті) не обмежений,
+    тож різних символів стільки, скільки треба.
+    """
+    shape = SHAPES[symbol_id % len(SHAPES)]
+    color = (symbol_id // len(SHAPES)) % colors
+    variant = symbol_id // (len(SHAPES) * colors)
+    return shape, color, variant
+
+
+def _spans(shape: str, y: float, half: float) -> List[Tuple[float, float]]:
+    """Горизонтальні відрізки фігури в рядку y (координати відносно центру)."""
+    ay = abs(y)
+    if shape == "circle":
+        if ay > half:
+            return []
+        radius = math.sqrt(half * half - y * y)
+        return [(-radius, radius)]
+    if shape == "square":
+        edge = half * 0.85
+        return [(-edge, edge)] if ay <= edge else []
+    if shape == "diamond":
+        return [(-(half - ay), half - ay)] if ay <= half else []
+    if shape == "triangle":
+        if ay > half * 0.9:
+            return []
+        width = half * (y + half * 0.9) / (1.8 * half)
+        return [(-width, width)]
+    if shape == "ring":
+        if ay > half:
+            return []
+        outer = math.sqrt(half * half - y * y)
+        inner_radius = half * 0.55
+        if ay >= inner_radius:
+            return [(-outer, outer)]
+        inner = math.sqrt(inner_radius * inner_radius - y * y)
+        return [(-outer, -inner), (inner, outer)]
+    if shape == "cross":
+        arm = half * 0.3
+        if ay <= arm:
+            return [(-half, half)]
+        return [(-arm, arm)] if ay <= half else []
+    if shape == "hexagon":
+        if ay > half * 0.87:
+            return []
+        width = half - ay / math.sqrt(3)
+        return [(-width, width)]
+    # "bar": дві горизонтальні смуги
+    if half * 0.15 <= ay <= half * 0.6:
+        return [(-half, half)]
+    return []
+
+
+class SymbolProvider:
+    def __init__(self, root: tk.Misc, size: int = 44, theme: str = "default", capacity: int = 256,
+                 disk_cache_dir: Optional[str] = None):
+        """Генератор зображень символів для карток з LRU-кешем.
+
+        Символ - це фігура певного кольору з номером варіанта в куті, намальована
+        один раз у PhotoImage потрібного розміру. Фон зображення прозорий, тож
+        колір стану картки (закрита/відкрита/знайдена) видно крізь нього.
+        Args:
+            root: Вікно Tk, якому належать зображення
+            size: Розмір плитки в пікселях
+            theme: Назва палітри з THEMES
+            capacity: Скільки зображень тримати в пам'яті
+            disk_cache_dir: Каталог для PNG-кешу (None - без диска); ключ - тема й розмір
+        """
+        self.root = root
+        self.size = size
+        self.theme = theme
+        self.palette = THEMES[theme]
+        self.capacity = capacity
+        self.disk_dir = os.path.join(disk_cache_dir, theme, str(size)) if disk_cache_dir else None
+        self.cache: "OrderedDict[int, tk.PhotoImage]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._back: Optional[tk.PhotoImage] = None
+        self._blank: Optional[tk.PhotoImage] = None
+        self._warm_queue: List[int] = []
+
+    def get(self, symbol_id: int) -> tk.PhotoImage:
+        """Зображення символу: з кешу в пам'яті, з диска або щойно намальоване."""
+        image = self.cache.get(symbol_id)
+        if image is not None:
+            self.hits += 1
+            self.cache.move_to_end(symbol_id)
+            return image
+        self.misses += 1
+        image = self._load(symbol_id) or self._render(symbol_id)
+        self.cache[symbol_id] = image
+        if len(self.cache) > self.capacity:
+            # Витіснене зображення живе, доки його показує хоч одна картка (GUI тримає посилання)
+            self.cache.popitem(last=False)
+        return image
+
+    def back(self) -> tk.PhotoImage:
+        """Зворот картки: білий знак питання на прозорому фоні."""
+        if self._back is None:
+            self._back = tk.PhotoImage(master=self.root, width=self.size, height=self.size)
+            scale = max(1, self.size // 8)
+            self._draw_text(self._back, "?", "#ffffff", scale,
+                            (self.size - 3 * scale) // 2, (self.size - 5 * scale) // 2)
+        return self._back
+
+    def blank(self) -> tk.PhotoImage:
+        """Повністю прозора плитка (порожня картка на непарному полі)."""
+        if self._blank is None:
+            self._blank = tk.PhotoImage(master=self.root, width=self.size, height=self.size)
+        return self._blank
+
+    def warm(self, symbol_ids: Iterable[int], per_idle: int = 8) -> None:
+        """Малює символи наперед невеликими порціями в idle, не блокуючи інтерфейс."""
+        self._warm_queue = [symbol_id for symbol_id in symbol_ids if symbol_id not in self.cache]
+        del self._warm_queue[self.capacity:]
+        if self._warm_queue:
+            self.root.after_idle(self._warm_step, per_idle)
+
+    def _warm_step(self, per_idle: int) -> None:
+        for _ in range(min(per_idle, len(self._warm_queue))):
+            symbol_id = self._warm_queue.pop()
+            if symbol_id not in self.cache:
+                self.get(symbol_id)
+                self.misses -= 1  # Попереднє малювання не рахується як промах кешу
+        if self._warm_queue:
+            self.root.after_idle(self._warm_step, per_idle)
+
+    def _path(self, symbol_id: int) -> Optional[str]:
+        return os.path.join(self.disk_dir, f"{symbol_id}.png") if self.disk_dir else None
+
+    def _load(self, symbol_id: int) -> Optional[tk.PhotoImage]:
+        path = self._path(symbol_id)
+        if path and os.path.exists(path):
+            try:
+                return tk.PhotoImage(master=self.root, file=path)
+            except tk.TclError:
+                return None  # Пошкоджений файл - намалюємо заново
+        return None
+
+    def _render(self, symbol_id: int) -> tk.PhotoImage:
+        """Малює плитку символу: фігура відрізками рядків + номер варіанта в куті."""
+        shape, color, variant = describe(symbol_id, len(self.palette))
+        size = self.size
+        image = tk.PhotoImage(master=self.root, width=size, height=size)
+        half = size * 0.38
+        center = size / 2
+        fill = self.palette[color]
+        for row in range(size):
+            for left, right in _spans(shape, row + 0.5 - center, half):
+                x0 = max(0, int(round(center + left)))
+                x1 = min(size, int(round(center + right)))
+                if x1 > x0:
+                    image.put(fill, to=(x0, row, x1, row + 1))
+        if variant:
+            scale = max(1, size // 22)
+            text = str(variant)
+            width = (4 * len(text) - 1) * scale
+            x, y = size - width - scale, size - 6 * scale
+            image.put("#ffffff", to=(x - scale, y - scale, size, size))
+            self._draw_text(image, text, "#2b2d42", scale, x, y)
+
+        path = self._path(symbol_id)
+        if path:
+            try:
+                os.makedirs(self.disk_dir, exist_ok=True)
+                image.write(path, format="png")
+            except (OSError, tk.TclError):
+                pass  # Дисковий кеш необов'язковий
+        return image
+
+    @staticmethod
+    def _draw_text(image: tk.PhotoImage, text: str, color: str, scale: int, x: int, y: int) -> None:
+        """Малює текст піксельним шрифтом 3x5 з масштабом scale."""
+        for char in text:
+            for row, bits in enumerate(_GLYPHS[char]):
+                for col, bit in enumerate(bits):
+                    if bit == "1":
+                        px, py = x + col * scale, y + row * scale
+                        image.put(color, to=(px, py, px + scale, py + scale))
+            x += 4 * scale
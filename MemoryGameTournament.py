@@ -0,0 +1,361 @@
+import argparse
+import math
+import os
+import random
+import time
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Set, Tuple
+
+from MemoryGameLogic import MemoryGameLogic
+
+
+class IndexPool:
+    """Множина індексів карток з O(1) додаванням, видаленням і випадковим вибором."""
+
+    def __init__(self):
+        self.items: List[int] = []
+        self.positions: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, idx: int) -> bool:
+        return idx in self.positions
+
+    def add(self, idx: int) -> None:
+        if idx not in self.positions:
+            self.positions[idx] = len(self.items)
+            self.items.append(idx)
+
+    def discard(self, idx: int) -> None:
+        pos = self.positions.pop(idx, None)
+        if pos is None:
+            return
+        last = self.items.pop()
+        if last != idx:
+            self.items[pos] = last
+            self.positions[last] = pos
+
+    def choice(self, rng: random.Random, exclude: Optional[int] = None) -> Optional[int]:
+        """Випадковий індекс з множини (крім exclude) або None, якщо вибирати нема з чого."""
+        size = len(self.items) - (exclude in self.positions)
+        if size <= 0:
+            return None
+        idx = self.items[rng.randrange(len(self.items))]
+        while idx == exclude:
+            idx = self.items[rng.randrange(len(self.items))]
+        return idx
+
+
+class Strategy:
+    """Скриптовий гравець: пам'ятає відкриті картки й обирає, що відкрити далі."""
+
+    name = "base"
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.unmatched = IndexPool()  # Незнайдені картки
+        self.unknown = IndexPool()  # Незнайдені картки, яких гравець не пам'ятає
+        self.memory: Dict[int, Tuple[str, float]] = {}  # Картка -> (символ, хід, до якого пам'ятає)
+        self.by_symbol: Dict[str, Set[int]] = {}  # Символ -> картки, які гравець пам'ятає
+        self.move = 0
+
+    def new_game(self, logic: MemoryGameLogic) -> None:
+        """Готує гравця до нової гри на полі logic."""
+        self.unmatched = IndexPool()
+        self.unknown = IndexPool()
+        for idx in range(logic.rows * logic.cols):
+            if not logic.is_matched(idx):
+                self.unmatched.add(idx)
+                self.unknown.add(idx)
+        self.memory = {}
+        self.by_symbol = {}
+        self.move = 0
+
+    def retention(self) -> float:
+        """Скільки ходів гравець пам'ятає щойно побачену картку (0 - не пам'ятає)."""
+        return math.inf
+
+    def _forget(self, idx: int) -> None:
+        symbol, _ = self.memory.pop(idx)
+        self.by_symbol[symbol].discard(idx)
+        if idx in self.unmatched:
+            self.unknown.add(idx)
+
+    def recall(self, idx: int) -> Optional[str]:
+        """Символ картки, якщо гравець її ще пам'ятає."""
+        entry = self.memory.get(idx)
+        if entry is None:
+            return None
+        if entry[1] < self.move:
+            self._forget(idx)
+            return None
+        return entry[0]
+
+    def observe(self, idx: int, symbol: str) -> None:
+        """Гравець бачить символ відкритої картки."""
+        if idx in self.memory:
+            self._forget(idx)
+        keep = self.retention()
+        if keep > 0:
+            self.memory[idx] = (symbol, self.move + keep)
+            self.by_symbol.setdefault(symbol, set()).add(idx)
+            self.unknown.discard(idx)
+
+    def matched(self, first: int, second: int) -> None:
+        """Пару знайдено - картки зникають з поля й з пам'яті."""
+        for idx in (first, second):
+            if idx in self.memory:
+                self._forget(idx)
+            self.unmatched.discard(idx)
+            self.unknown.discard(idx)
+
+    def known_partner(self, idx: int, symbol: str) -> Optional[int]:
+        """Інша картка з тим самим символом, яку гравець пам'ятає."""
+        for other in list(self.by_symbol.get(symbol, ())):
+            if other != idx and self.recall(other) is not None:
+                return other
+        return None
+
+    def known_pair(self) -> Optional[Tuple[int, int]]:
+        """Пара карток з однаковим символом, які гравець пам'ятає."""
+        for symbol, cards in self.by_symbol.items():
+            if len(cards) >= 2:
+                first = next(iter(cards))
+                if self.recall(first) is not None:
+                    second = self.known_partner(first, symbol)
+                    if second is not None:
+                        return first, second
+        return None
+
+    def choose_first(self) -> int:
+        pair = self.known_pair()
+        if pair:
+            return pair[0]
+        idx = self.unknown.choice(self.rng)
+        return idx if idx is not None else self.unmatched.choice(self.rng)
+
+    def choose_second(self, first: int, symbol: str) -> int:
+        partner = self.known_partner(first, symbol)
+        if partner is not None:
+            return partner
+        idx = self.unknown.choice(self.rng, exclude=first)
+        return idx if idx is not None else self.unmatched.choice(self.rng, exclude=first)
+
+
+class RandomStrategy(Strategy):
+    """Без пам'яті: дві випадкові незнайдені картки."""
+
+    name = "random"
+
+    def retention(self) -> float:
+        return 0
+
+
+class PerfectMemoryStrategy(Strategy):
+    """Ідеальна пам'ять: відома пара, інакше невідома картка й добір пари до неї."""
+
+    name = "perfect"
+
+
+class GreedyStrategy(Strategy):
+    """Пам'ятає все, але використовує пам'ять лише для негайних збігів, без розвідки невідомих карток."""
+
+    name = "greedy"
+
+    def choose_first(self) -> int:
+        pair = self.known_pair()
+        return pair[0] if pair else self.unmatched.choice(self.rng)
+
+    def choose_second(self, first: int, symbol: str) -> int:
+        partner = self.known_partner(first, symbol)
+        return partner if partner is not None else self.unmatched.choice(self.rng, exclude=first)
+
+
+class DecayMemoryStrategy(Strategy):
+    """Пам'ять зі згасанням: кожна картка забувається через випадкову кількість ходів."""
+
+    name = "decay"
+
+    def __init__(self, rng: random.Random, mean_retention: float = 8.0):
+        super().__init__(rng)
+        self.mean_retention = mean_retention
+
+    def retention(self) -> float:
+        return self.rng.expovariate(1 / self.mean_retention)
+
+
+STRATEGIES = {
+    cls.name: cls for cls in (RandomStrategy, GreedyStrategy, PerfectMemoryStrategy, DecayMemoryStrategy)
+}
+
+
+def play_game(strategy: Strategy, logic: MemoryGameLogic, rows: int, cols: int, seed: int,
+              max_moves: int) -> int:
+    """Грає одну гру стратегією через MemoryGameLogic.
+
+    Returns:
+        int: Кількість ходів (max_moves, якщо гра не завершилась)
+    """
+    logic.setup_game(rows, cols, seed)
+    strategy.new_game(logic)
+    while not logic.check_win() and logic.moves < max_moves:
+        strategy.move = logic.moves
+        first = strategy.choose_first()
+        _, _, first_symbol = logic.handle_click(first)
+        strategy.observe(first, first_symbol)
+        second = strategy.choose_second(first, first_symbol)
+        is_match, _, second_symbol = logic.handle_click(second)
+        strategy.observe(second, second_symbol)
+        if is_match:
+            strategy.matched(first, second)
+        logic.reset_turn()
+    return logic.moves
+
+
+class Aggregate:
+    """Зведені результати стратегії, які можна зливати між процесами."""
+
+    def __init__(self):
+        self.games = 0
+        self.total = 0
+        self.total_sq = 0
+        self.best = math.inf
+        self.worst = 0
+        self.wins = 0  # Дошки, на яких стратегія мала строго найменше ходів
+        self.histogram: Counter = Counter()
+
+    def add(self, moves: int) -> None:
+        self.games += 1
+        self.total += moves
+        self.total_sq += moves * moves
+        self.best = min(self.best, moves)
+        self.worst = max(self.worst, moves)
+        self.histogram[moves] += 1
+
+    def merge(self, other: "Aggregate") -> None:
+        self.games += other.games
+        self.total += other.total
+        self.total_sq += other.total_sq
+        self.best = min(self.best, other.best)
+        self.worst = max(self.worst, other.worst)
+        self.wins += other.wins
+        self.histogram.update(other.histogram)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.games if self.games else 0.0
+
+    @property
+    def std(self) -> float:
+        if not self.games:
+            return 0.0
+        return math.sqrt(max(0.0, self.total_sq / self.games - self.mean ** 2))
+
+    def percentile(self, q: float) -> int:
+        """Перцентиль кількості ходів з гістограми."""
+        threshold = q / 100 * self.games
+        seen = 0
+        for moves in sorted(self.histogram):
+            seen += self.histogram[moves]
+            if seen >= threshold:
+                return moves
+        return self.worst
+
+
+def board_seed(base_seed: int, board: int) -> int:
+    """Детерміноване зерно дошки: не залежить від кількості процесів і розбиття на частини."""
+    return random.Random(base_seed * 1_000_003 + board).getrandbits(64)
+
+
+def run_chunk(names: List[str], rows: int, cols: int, base_seed: int, start: int,
+              count: int) -> Dict[str, Aggregate]:
+    """Грає дошки [start, start + count) усіма стратегіями (виконується у процесі-воркері)."""
+    logic = MemoryGameLogic()
+    results = {name: Aggregate() for name in names}
+    max_moves = 50 * rows * cols
+    for board in range(start, start + count):
+        seed = board_seed(base_seed, board)
+        moves: Dict[str, int] = {}
+        for name in names:
+            # Зерно стратегії - від її імені, а не позиції в списку: результати не залежать від набору суперників
+            strategy = STRATEGIES[name](random.Random(seed ^ zlib.crc32(name.encode())))
+            moves[name] = play_game(strategy, logic, rows, cols, seed, max_moves)
+            results[name].add(moves[name])
+        best = min(moves.values())
+        leaders = [name for name, value in moves.items() if value == best]
+        if len(leaders) == 1:
+            results[leaders[0]].wins += 1
+    return results
+
+
+def run_tournament(names: List[str], rows: int, cols: int, boards: int, workers: int,
+                   base_seed: int = 0, chunk_size: int = 200) -> Dict[str, Aggregate]:
+    """Проводить турнір на пулі процесів, зливаючи результати в міру надходження.
+
+    Args:
+        names: Назви стратегій
+        rows: Кількість рядків сітки
+        cols: Кількість стовпців сітки
+        boards: Кількість дошок (кожну грають усі стратегії)
+        workers: Кількість процесів
+        base_seed: Базове зерно турніру
+        chunk_size: Кількість дошок в одному завданні для воркера
+    Returns:
+        Dict[str, Aggregate]: Зведені результати кожної стратегії
+    """
+    totals = {name: Aggregate() for name in names}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(run_chunk, names, rows, cols, base_seed, start, min(chunk_size, boards - start))
+            for start in range(0, boards, chunk_size)
+        ]
+        for future in as_completed(futures):
+            for name, partial in future.result().items():
+                totals[name].merge(partial)
+    return totals
+
+
+def print_results(totals: Dict[str, Aggregate]) -> None:
+    """Друкує таблицю результатів, упорядковану за середньою кількістю ходів."""
+    for name, result in sorted(totals.items(), key=lambda item: item[1].mean):
+        print(f"{name:>8}: mean={result.mean:8.2f} std={result.std:7.2f} "
+              f"p50={result.percentile(50):5d} p90={result.percentile(90):5d} "
+              f"best={result.best:5} worst={result.worst:5} wins={result.wins}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Турнір скриптових стратегій Memory Game на всіх ядрах")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), action="append",
+                        help="Стратегія-учасник (можна кілька разів; за замовчуванням усі)")
+    parser.add_argument("--level", default="Hard", help="Рівень складності з MemoryGameLogic")
+    parser.add_argument("--boards", type=int, default=20000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scaling", action="store_true",
+                        help="Виміряти прискорення для 1, 2, 4, ... процесів")
+    args = parser.parse_args()
+
+    strategy_names = args.strategy or sorted(STRATEGIES)
+    level_rows, level_cols = MemoryGameLogic().difficulty_levels[args.level]
+
+    if args.scaling:
+        counts = sorted({min(2 ** power, args.workers) for power in range(args.workers.bit_length() + 1)})
+        baseline = None
+        for workers in counts:
+            start_time = time.perf_counter()
+            run_tournament(strategy_names, level_rows, level_cols, args.boards, workers, args.seed)
+            elapsed = time.perf_counter() - start_time
+            baseline = baseline or elapsed
+            speedup = baseline / elapsed
+            print(f"{workers:3d} процесів: {elapsed:7.2f} с, {args.boards / elapsed:9.0f} дошок/с, "
+                  f"прискорення {speedup:5.2f}x, ефективність {speedup / workers:5.0%}")
+    else:
+        start_time = time.perf_counter()
+        results = run_tournament(strategy_names, level_rows, level_cols, args.boards, args.workers, args.seed)
+        elapsed = time.perf_counter() - start_time
+        print(f"{args.level} ({level_rows}x{level_cols}), {args.boards} дошок, "
+              f"{args.workers} процесів, {elapsed:.2f} с")
+        print_results(results)
@@ -0,0 +1,90 @@
+from contextlib import nullcontext
+from typing import Callable, ContextManager, List, Optional, Tuple, Union, TYPE_CHECKING
+
+from MemoryGameLogic import MemoryGameLogic
+from MemoryGameSolver import par_for_grid
+
+if TYPE_CHECKING:
+    from MemoryGameCurses import CursesView
+    from MemoryGameGUI import MemoryGameGUI
+
+_NO_STAGE = nullcontext()  # Етап без вимірювання (термінал, вимкнений профайлер)
+
+
+class TurnFlow:
+    def __init__(self, logic: MemoryGameLogic, view: Union["MemoryGameGUI", "CursesView"],
+                 stage: Optional[Callable[[str], ContextManager]] = None):
+        """Перебіг ходу, спільний для Tk- і термінального контролерів (без tkinter і таймерів).
+
+        Відкриває картки в логіці й на поданні, тримає невдалу пару, яку ще
+        показують, і оголошує перемогу. Коли саме закривати невдалу пару, вирішує
+        контролер: Tk - таймером after, термінал - таймаутом getch.
+        Args:
+            logic: Логіка гри
+            view: Подання поля (MemoryGameGUI або CursesView)
+            stage: Вимірювання етапів ходу, напр. ClickProfiler.stage (None - без вимірювання)
+        """
+        self.logic = logic
+        self.view = view
+        self.stage = stage or (lambda name: _NO_STAGE)
+        self.pending_reset: Optional[Tuple[int, int]] = None  # Невдала пара, ще відкрита на екрані
+
+    def begin(self) -> None:
+        """Показує щойно розкладене поле: порожня картка неактивна, лічильник ходів з нуля."""
+        self.pending_reset = None
+        if self.logic.blank_index is not None:
+            # Порожня картка на непарному полі одразу неактивна
+            self.view.update_button(self.logic.blank_index, "", True)
+        self.view.update_moves(self.logic.moves)
+
+    def reset_pending(self) -> bool:
+        """Закриває невдалу пару, якщо вона ще відкрита. Повертає, чи було що закривати."""
+        if self.pending_reset is None:
+            return False
+        idx1, idx2 = self.pending_reset
+        self.pending_reset = None
+        self.view.reset_button(idx1)
+        self.view.reset_button(idx2)
+        self.logic.reset_turn()
+        return True
+
+    def flip(self, idx: int, hold_mismatch: bool = True) -> Tuple[bool, Optional[int], str]:
+        """Відкриває картку в логіці й на поданні.
+
+        Args:
+            idx: Індекс клікнутої картки
+            hold_mismatch: Невдала пара лишається відкритою до reset_pending (False -
+                швидкий режим: хід у логіці завершується одразу, картки ховає контролер)
+        Returns:
+            Tuple[bool, Optional[int], str]: Те саме, що MemoryGameLogic.handle_click
+        """
+        logic = self.logic
+        stage = self.stage
+        with stage("logic.handle_click"):
+            is_match, first_index, symbol = logic.handle_click(idx)
+        if symbol:
+            with stage("gui.update_button"):
+                self.view.update_button(idx, symbol, symbol_id=logic.symbol_ids[idx])
+        if is_match:
+            with stage("gui.update_button"):
+                symbol_id = logic.symbol_ids[idx]
+                self.view.update_button(idx, symbol, True, symbol_id)
+                self.view.update_button(first_index, symbol, True, symbol_id)
+            logic.reset_turn()
+        elif first_index is not None:
+            if hold_mismatch:
+                self.pending_reset = (idx, first_index)
+            else:
+                logic.reset_turn()
+        with stage("gui.update_moves"):
+            self.view.update_moves(logic.moves)
+        return is_match, first_index, symbol
+
+    def announce_win(self, scores: Optional[List[int]] = None) -> None:
+        """Показує повідомлення про завершення гри.
+
+        Args:
+            scores: Рахунок гри вдвох; тоді замість par (яке стосується одного гравця) показується переможець
+        """
+        par = par_for_grid(self.logic.rows, self.logic.cols) if scores is None else None
+        self.view.show_win_message(self.logic.moves, par, scores)
@@ -0,0 +1,104 @@
+"""Пул кнопок-карток MemoryGameGUI між іграми (віджети Tk підмінені заглушками, дисплей не потрібен)."""
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import MemoryGameGUI  # noqa: E402
+
+
+class FakeWidget:
+    """Заглушка віджета Tk: запам'ятовує опції й розміщення."""
+
+    def __init__(self, master=None, **options):
+        self.options = dict(options)
+        self.gridded = False
+
+    def config(self, **options):
+        self.options.update(options)
+
+    configure = config
+
+    def grid(self, **options):
+        self.gridded = True
+
+    def grid_remove(self):
+        self.gridded = False
+
+    def __getattr__(self, name):
+        # pack, pack_forget, bind, grid_columnconfigure тощо - нічого не роблять
+        return lambda *args, **kwargs: None
+
+
+class FakeRoot(FakeWidget):
+    def after_idle(self, callback, *args):
+        pass  # Черга оновлень застосовується в тесті явно через flush_updates
+
+
+@pytest.fixture
+def gui(monkeypatch):
+    for name in ("Button", "Frame", "Label"):
+        monkeypatch.setattr(MemoryGameGUI.tk, name, FakeWidget)
+    view = MemoryGameGUI.MemoryGameGUI(FakeRoot(), {"Easy": (3, 4), "Hard": (5, 6)})
+    view.renderer = "buttons"
+    return view
+
+
+def _finish_game(view, cards):
+    for idx in range(cards):
+        view.update_button(idx, "🐶", True, 0)
+    view.flush_updates()
+
+
+def test_pooled_buttons_are_reset_after_smaller_board(gui):
+    # Hard -> Easy -> Hard: кнопки 12-29 ховались на час гри Easy і мають повернутися закритими
+    gui.setup_board(5, 6, lambda idx: None)
+    _finish_game(gui, 30)
+    gui.setup_board(3, 4, lambda idx: None)
+    _finish_game(gui, 12)
+    gui.setup_board(5, 6, lambda idx: None)
+    gui.flush_updates()
+    assert gui.shown_cards == 30
+    for idx, button in enumerate(gui.buttons[:30]):
+        assert button.gridded, idx
+        assert button.options["state"] == "normal", idx
+        assert button.options["text"] == "?", idx
+
+
+class FakeCanvasBoard(FakeWidget):
+    def __init__(self, master, rows, cols, command, gui):
+        super().__init__(master)
+        self.rows, self.cols = rows, cols
+        self.frame = FakeWidget()
+
+
+def test_pooled_buttons_are_reset_after_canvas_board(gui, monkeypatch):
+    # Кнопки -> полотно -> кнопки: полотно ховає весь пул, а гра на ньому не торкається кнопок
+    canvas_module = types.ModuleType("MemoryGameCanvas")
+    canvas_module.CanvasBoard = FakeCanvasBoard
+    monkeypatch.setitem(sys.modules, "MemoryGameCanvas", canvas_module)
+    gui.setup_board(5, 6, lambda idx: None)
+    _finish_game(gui, 30)
+    gui.renderer = "canvas"
+    gui.setup_board(5, 6, lambda idx: None)
+    assert not any(button.gridded for button in gui.buttons)
+    gui.renderer = "buttons"
+    gui.setup_board(5, 6, lambda idx: None)
+    gui.flush_updates()
+    assert gui.canvas_board is None
+    for idx, button in enumerate(gui.buttons[:30]):
+        assert button.gridded, idx
+        assert button.options["state"] == "normal", idx
+        assert button.options["text"] == "?", idx
+
+
+def test_menu_shows_par_computed_after_first_frame(gui):
+    gui.setup_menu(lambda rows, cols: None)
+    assert gui.level_buttons["Hard"].options["text"] == "Hard (5×6)"
+    gui.set_level_par({"Easy": 8.5, "Hard": 40.0})
+    gui.flush_updates()
+    assert gui.level_buttons["Easy"].options["text"] == "Easy (3×4) · par 8.5"
+    assert gui.level_buttons["Hard"].options["text"] == "Hard (5×6) · par 40.0"
@@ -0,0 +1,59 @@
+"""Відновлення гри зі знімка: пошкоджені й неможливі розклади відкидаються."""
+import os
+import sys
+from array import array
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from MemoryGameLogic import MemoryGameLogic, BLANK_ID  # noqa: E402
+from MemoryGameSnapshot import HEADER, MAGIC, SnapshotWriter, _valid_layout, load_snapshot  # noqa: E402
+
+
+def _write(path, rows, cols, symbol_ids, matched, first_index=-1):
+    ids = array("I", symbol_ids)
+    if sys.byteorder != "little":
+        ids.byteswap()
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, rows, cols, 1, 3, first_index, 2.5))
+        file.write(ids.tobytes())
+        file.write(bytes(matched))
+    return str(path)
+
+
+def test_saved_game_round_trips(tmp_path):
+    logic = MemoryGameLogic()
+    logic.setup_game(3, 3, seed=5)
+    logic.handle_click(0 if logic.blank_index else 1)
+    writer = SnapshotWriter(str(tmp_path / "game.bin"))
+    writer.start_game(logic)
+    writer.save(logic, 1.0)
+    writer.close()
+    snapshot = load_snapshot(str(tmp_path / "game.bin"))
+    assert snapshot is not None
+    assert list(snapshot.symbol_ids) == list(logic.symbol_ids)
+    assert snapshot.first_index == logic.first_index
+
+
+@pytest.mark.parametrize("symbol_ids, matched, first_index", [
+    ([0, 0, 0, 1], [0], -1),  # Символ тричі, інший один раз
+    ([0, 1, 2, 3], [0], -1),  # Жодної пари
+    ([0, 0, 1, 1], [0b0011], 0),  # Перша картка ходу вже знайдена
+    ([0, 0, 1, 1], [0b10000], -1),  # Зайвий біт за межами поля
+    ([0, 0, BLANK_ID, BLANK_ID], [0b1100], -1),  # Порожня картка на парному полі
+])
+def test_impossible_layouts_are_rejected(tmp_path, symbol_ids, matched, first_index):
+    assert load_snapshot(_write(tmp_path / "game.bin", 2, 2, symbol_ids, matched, first_index)) is None
+
+
+def test_out_of_range_first_index_is_rejected(tmp_path):
+    assert load_snapshot(_write(tmp_path / "game.bin", 2, 2, [0, 0, 1, 1], [0], 4)) is None
+
+
+def test_validation_leaves_symbol_ids_untouched():
+    symbol_ids = array("I", [1, BLANK_ID, 1, 0, 0])
+    before = symbol_ids.tolist()
+    assert _valid_layout(symbol_ids, bytearray([0b10]), 5, -1)
+    assert symbol_ids.tolist() == before
+    assert not _valid_layout(symbol_ids, bytearray([0]), 5, -1)  # Порожня картка не знайдена